@@ -10,6 +10,7 @@ Features:
 - Clean, functional UI following user specifications
 """
 
+import html
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Any
@@ -75,6 +76,9 @@ except ImportError:
 
 from cascade_linter.gui.tools.beginner_helpers import BeginnerFriendlyHelpers
 
+# Issue severity -> LogViewer log level (LOG_INFO, LOG_WARNING, LOG_ERROR)
+_SEVERITY_LEVELS = {"info": 0, "warning": 1, "error": 2}
+
 
 class LintingWorker(QThread):
     """Worker thread for running linting operations"""
@@ -83,6 +87,7 @@ class LintingWorker(QThread):
     stage_completed = Signal(str)  # linter_name
     linting_completed = Signal(dict)  # results
     log_message = Signal(str)  # log_html
+    log_record = Signal(int, str)  # log_level, escaped_text
 
     def __init__(
         self,
@@ -286,23 +291,15 @@ class LintingWorker(QThread):
                         )
                         self.log_message.emit(friendly_line)
                     else:
-                        # Standard formatting
-                        severity_colors = {
-                            "error": "#FF5722",
-                            "warning": "#FF9800",
-                            "info": "#2196F3",
-                        }
-                        color = severity_colors.get(
-                            issue.severity.severity_name, "#FF9800"
-                        )
-
-                        # Format the issue line
+                        # Standard formatting - escape the tool output here,
+                        # off the GUI thread
+                        level = _SEVERITY_LEVELS.get(issue.severity.severity_name, 1)
                         fixable_icon = "🔧" if issue.fixable else "👨‍💻"
                         issue_line = (
-                            f'<span style="color: {color};">   {fixable_icon} Line {issue.line}:{issue.column} '
-                            f"[{issue.code}] {issue.message}</span>"
+                            f"   {fixable_icon} Line {issue.line}:{issue.column} "
+                            f"[{issue.code}] {issue.message}"
                         )
-                        self.log_message.emit(issue_line)
+                        self.log_record.emit(level, html.escape(issue_line))
 
                 # Add some spacing
                 self.log_message.emit('<span style="color: #555;">   </span>')
@@ -986,6 +983,7 @@ class ModernMainWindow(QMainWindow):
         self.current_worker.stage_completed.connect(self.on_stage_completed)
         self.current_worker.linting_completed.connect(self.on_linting_completed)
         self.current_worker.log_message.connect(self.on_log_message)
+        self.current_worker.log_record.connect(self.on_log_record)
         self.current_worker.start()
 
     @Slot()
@@ -1082,6 +1080,15 @@ class ModernMainWindow(QMainWindow):
             # Fallback for basic QTextEdit
             self.log_viewer.append(html_message)
 
+    @Slot(int, str)
+    def on_log_record(self, level: int, escaped_text: str):
+        """Handle leveled log records escaped by the worker"""
+        if hasattr(self.log_viewer, "append_record"):
+            self.log_viewer.append_record(level, escaped_text)
+        else:
+            # Fallback for basic QTextEdit
+            self.log_viewer.append(escaped_text)
+
     @Slot()
     def show_settings(self):
         """Show the settings dialog"""
@@ -6,11 +6,51 @@ This is a fallback that provides the essential dependency analysis
 
 import ast
 import os
+import sys
 import json
+from bisect import bisect_right
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
+# NumPy is optional - it only speeds up aggregation on very large projects
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Risk levels in index order used by the aggregation arrays
+RISK_LEVELS = ("CRITICAL", "MEDIUM", "LOW")
+_RISK_LEVEL_INDEX = {level: index for index, level in enumerate(RISK_LEVELS)}
+
+# Upper bounds (exclusive) of the average risk score for each health grade
+_HEALTH_THRESHOLDS = (0.2, 0.4, 0.6)
+_HEALTH_GRADES = ("A", "B", "C", "F")
+
+# Fields exported in the analysis results, fetched with a single attrgetter
+_MODULE_FIELDS = (
+    "name",
+    "file_path",
+    "size_lines",
+    "functions",
+    "classes",
+    "complexity_score",
+)
+_ASSESSMENT_FIELDS = (
+    "module_name",
+    "risk_level",
+    "risk_score",
+    "impact_score",
+    "complexity_score",
+    "risk_factors",
+)
+_get_module_fields = attrgetter(*_MODULE_FIELDS)
+_get_assessment_fields = attrgetter(*_ASSESSMENT_FIELDS)
+
 
 @dataclass
 class ModuleInfo:
@@ -43,6 +83,12 @@ class SimpleDependencyAnalyzer:
         self.modules: Dict[str, ModuleInfo] = {}
         self.risk_assessments: Dict[str, RiskAssessment] = {}
 
+        # Per-module aggregation columns, filled by _calculate_risk_assessments
+        # (numpy arrays when available, plain lists otherwise)
+        self._risk_score_arr: Any = []
+        self._risk_level_arr: Any = []
+        self._complexity_arr: Any = []
+
     def analyze_project(self, project_paths: List[str]) -> Dict[str, Any]:
         """Analyze Python projects and return results"""
 
@@ -64,11 +110,11 @@ class SimpleDependencyAnalyzer:
         results = {
             "total_modules": len(self.modules),
             "modules": {
-                name: self._module_to_dict(module)
+                name: dict(zip(_MODULE_FIELDS, _get_module_fields(module)))
                 for name, module in self.modules.items()
             },
             "risk_assessments": {
-                name: self._assessment_to_dict(assessment)
+                name: dict(zip(_ASSESSMENT_FIELDS, _get_assessment_fields(assessment)))
                 for name, assessment in self.risk_assessments.items()
             },
             "project_health": project_health,
@@ -95,7 +141,9 @@ class SimpleDependencyAnalyzer:
 
                 # Generate module name from file path
                 relative_path = file_path.relative_to(project_root)
-                module_name = str(relative_path.with_suffix("")).replace(os.sep, ".")
+                module_name = sys.intern(
+                    str(relative_path.with_suffix("")).replace(os.sep, ".")
+                )
 
                 # Analyze the module
                 module_info = self._analyze_module(file_path, module_name)
@@ -126,7 +174,8 @@ class SimpleDependencyAnalyzer:
                 ]
             )
 
-            # Extract information from AST
+            # Extract information from AST (names are interned because the
+            # same import strings repeat across most modules of a project)
             imports = []
             from_imports = []
             functions = []
@@ -136,15 +185,15 @@ class SimpleDependencyAnalyzer:
             for node in ast.walk(tree):
                 if isinstance(node, ast.Import):
                     for alias in node.names:
-                        imports.append(alias.name)
+                        imports.append(sys.intern(alias.name))
                 elif isinstance(node, ast.ImportFrom):
                     if node.module:
-                        from_imports.append(node.module)
+                        from_imports.append(sys.intern(node.module))
                 elif isinstance(node, ast.FunctionDef):
-                    functions.append(node.name)
+                    functions.append(sys.intern(node.name))
                     complexity_score += self._calculate_complexity(node)
                 elif isinstance(node, ast.ClassDef):
-                    classes.append(node.name)
+                    classes.append(sys.intern(node.name))
                     complexity_score += 2  # Classes add base complexity
 
             return ModuleInfo(
@@ -176,9 +225,26 @@ class SimpleDependencyAnalyzer:
 
     def _calculate_risk_assessments(self):
         """Calculate risk assessments for all modules"""
-        for module_name, module_info in self.modules.items():
+        count = len(self.modules)
+        if NUMPY_AVAILABLE:
+            scores = np.empty(count, dtype=np.float64)
+            levels = np.empty(count, dtype=np.int8)
+            complexities = np.empty(count, dtype=np.float64)
+        else:
+            scores = [0.0] * count
+            levels = [0] * count
+            complexities = [0.0] * count
+
+        for index, (module_name, module_info) in enumerate(self.modules.items()):
             assessment = self._assess_module_risk(module_info)
             self.risk_assessments[module_name] = assessment
+            scores[index] = assessment.risk_score
+            levels[index] = _RISK_LEVEL_INDEX[assessment.risk_level]
+            complexities[index] = module_info.complexity_score
+
+        self._risk_score_arr = scores
+        self._risk_level_arr = levels
+        self._complexity_arr = complexities
 
     def _assess_module_risk(self, module_info: ModuleInfo) -> RiskAssessment:
         """Assess risk level for a single module"""
@@ -233,23 +299,15 @@ class SimpleDependencyAnalyzer:
             return {}
 
         # Calculate averages
-        total_complexity = sum(m.complexity_score for m in self.modules.values())
-        avg_complexity = total_complexity / len(self.modules)
-
-        total_risk = sum(r.risk_score for r in self.risk_assessments.values())
-        avg_risk_score = (
-            total_risk / len(self.risk_assessments) if self.risk_assessments else 0
-        )
+        if NUMPY_AVAILABLE:
+            avg_complexity = float(self._complexity_arr.mean())
+            avg_risk_score = float(self._risk_score_arr.mean())
+        else:
+            avg_complexity = sum(self._complexity_arr) / len(self._complexity_arr)
+            avg_risk_score = sum(self._risk_score_arr) / len(self._risk_score_arr)
 
         # Calculate health grade
-        if avg_risk_score < 0.2:
-            health_grade = "A"
-        elif avg_risk_score < 0.4:
-            health_grade = "B"
-        elif avg_risk_score < 0.6:
-            health_grade = "C"
-        else:
-            health_grade = "F"
+        health_grade = _HEALTH_GRADES[bisect_right(_HEALTH_THRESHOLDS, avg_risk_score)]
 
         return {
             "health_grade": health_grade,
@@ -259,30 +317,11 @@ class SimpleDependencyAnalyzer:
 
     def _get_risk_distribution(self) -> Dict[str, int]:
         """Get distribution of risk levels"""
-        distribution = {"CRITICAL": 0, "MEDIUM": 0, "LOW": 0}
-        for assessment in self.risk_assessments.values():
-            distribution[assessment.risk_level] += 1
-        return distribution
-
-    def _module_to_dict(self, module: ModuleInfo) -> Dict[str, Any]:
-        return {
-            "name": module.name,
-            "file_path": module.file_path,
-            "size_lines": module.size_lines,
-            "functions": module.functions,
-            "classes": module.classes,
-            "complexity_score": module.complexity_score,
-        }
-
-    def _assessment_to_dict(self, assessment: RiskAssessment) -> Dict[str, Any]:
-        return {
-            "module_name": assessment.module_name,
-            "risk_level": assessment.risk_level,
-            "risk_score": assessment.risk_score,
-            "impact_score": assessment.impact_score,
-            "complexity_score": assessment.complexity_score,
-            "risk_factors": assessment.risk_factors,
-        }
+        if NUMPY_AVAILABLE:
+            counts = np.bincount(self._risk_level_arr, minlength=len(RISK_LEVELS))
+        else:
+            counts = [self._risk_level_arr.count(i) for i in range(len(RISK_LEVELS))]
+        return {level: int(counts[i]) for i, level in enumerate(RISK_LEVELS)}
 
 
 # For easy importing
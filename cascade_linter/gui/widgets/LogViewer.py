@@ -1,17 +1,87 @@
 # cascade_linter/gui/widgets/LogViewer.py
 
+import html
+from collections import deque
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QCheckBox,
+    QButtonGroup,
+    QAbstractButton,
     QLabel,
     QPushButton,
 )
-from PySide6.QtCore import Qt, Slot, Signal
+from PySide6.QtCore import Qt, Slot, Signal, QTimer
 from PySide6.QtGui import QFont, QTextCursor, QTextOption
 
+# Wrapper giving each log line its own block with a small margin. A batch of
+# fragments is wrapped with a single join instead of formatting every line.
+_DIV_OPEN = '<div style="margin-bottom: 4px; line-height: 1.2;">'
+_DIV_CLOSE = "</div>"
+_DIV_SEPARATOR = _DIV_CLOSE + _DIV_OPEN
+
+# Log record levels - producers emit (level, escaped_text) and the viewer
+# only has to prepend the matching span
+LOG_INFO = 0
+LOG_WARNING = 1
+LOG_ERROR = 2
+
+# Span openers indexed by log level
+_LEVEL_PREFIX = (
+    '<span style="color: #2196F3;">',  # Info - blue
+    '<span style="color: #FF9800;">',  # Warning - orange
+    '<span style="color: #FF5722;">',  # Error - red
+)
+_SPAN_CLOSE = "</span>"
+
+# Linter filter bits - the active filter set is a single int mask
+LINTER_RUFF = 1
+LINTER_FLAKE8 = 2
+LINTER_PYLINT = 4
+LINTER_BANDIT = 8
+LINTER_MYPY = 16
+LINTER_ALL = LINTER_RUFF | LINTER_FLAKE8 | LINTER_PYLINT | LINTER_BANDIT | LINTER_MYPY
+
+# (label, filter bit, accent color) for each linter filter checkbox
+_LINTER_FILTERS = (
+    ("Ruff", LINTER_RUFF, "#e74c3c"),  # Red
+    ("Flake8", LINTER_FLAKE8, "#f39c12"),  # Orange
+    ("Pylint", LINTER_PYLINT, "#9b59b6"),  # Purple
+    ("Bandit", LINTER_BANDIT, "#e67e22"),  # Dark orange
+    ("MyPy", LINTER_MYPY, "#3498db"),  # Blue
+)
+
+# Per-linter checkbox rules, selected by objectName and built once so the
+# whole widget is styled by a single stylesheet parse
+_FILTER_CHECKBOX_STYLE = """
+    QCheckBox#chk{name} {{
+        font-weight: bold;
+        color: {color};
+        spacing: 6px;
+    }}
+    QCheckBox#chk{name}::indicator {{
+        width: 16px;
+        height: 16px;
+    }}
+    QCheckBox#chk{name}::indicator:checked {{
+        background-color: {color};
+        border: 1px solid #888a85;
+        border-radius: 3px;
+    }}
+    QCheckBox#chk{name}::indicator:unchecked {{
+        background-color: #555753;
+        border: 1px solid #888a85;
+        border-radius: 3px;
+    }}
+"""
+_FILTER_STYLESHEET = "".join(
+    _FILTER_CHECKBOX_STYLE.format(name=name, color=color)
+    for name, _bit, color in _LINTER_FILTERS
+)
+
 
 class LogViewer(QWidget):
     """
@@ -29,6 +99,11 @@ class LogViewer(QWidget):
 
     # Signals
     exportRequested = Signal()
+    filterChanged = Signal(int)  # Bitmask of enabled LINTER_* flags
+
+    # Linter keys in checkbox order, with a lookup built once per class
+    _LINTERS = tuple(name.lower() for name, _bit, _color in _LINTER_FILTERS)
+    _LINTER_INDEX = {name: index for index, name in enumerate(_LINTERS)}
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -36,7 +111,21 @@ class LogViewer(QWidget):
         # Internal state
         self._auto_scroll = True
         self._line_count = 0
-        self._max_lines = 1000  # Prevent memory issues
+        self._max_lines = 2000  # Oldest blocks are dropped beyond this
+        self._filter_mask = LINTER_ALL
+
+        # Appends are buffered and flushed together so bursts of log lines
+        # cost one layout + repaint per flush instead of one per line
+        self._pending_html = []
+
+        # Mirror of the displayed fragments so get_html() can join them
+        # instead of serializing the whole QTextDocument
+        self._html_buffer = deque(maxlen=self._max_lines)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
 
         # Initialize UI
         self.init_ui()
@@ -69,59 +158,48 @@ class LogViewer(QWidget):
         filter_label.setStyleSheet("font-weight: bold;")
         filter_layout.addWidget(filter_label)
 
-        # Create filter checkboxes for each linter
-        self.filters = {}
-        linters = [
-            ("Ruff", "#e74c3c", True),  # Red
-            ("Flake8", "#f39c12", True),  # Orange
-            ("Pylint", "#9b59b6", True),  # Purple
-            ("Bandit", "#e67e22", True),  # Dark orange
-            ("MyPy", "#3498db", True),  # Blue
-        ]
-
-        for linter, color, checked in linters:
+        # Create filter checkboxes for each linter; a non-exclusive button
+        # group gives one connection for all of them
+        checkboxes = []
+        self._filter_group = QButtonGroup(self)
+        self._filter_group.setExclusive(False)
+        for linter, bit, _color in _LINTER_FILTERS:
+            checked = bool(self._filter_mask & bit)
             checkbox = QCheckBox(linter)
+            checkbox.setObjectName(f"chk{linter}")
             checkbox.setChecked(checked)
             checkbox.setToolTip(f"Show/hide logs from {linter} linter")
-            checkbox.setStyleSheet(
-                f"""
-                QCheckBox {{
-                    font-weight: bold;
-                    color: {color};
-                    spacing: 6px;
-                }}
-                QCheckBox::indicator {{
-                    width: 16px;
-                    height: 16px;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: {color};
-                    border: 1px solid #888a85;
-                    border-radius: 3px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    background-color: #555753;
-                    border: 1px solid #888a85;
-                    border-radius: 3px;
-                }}
-            """
-            )
-            checkbox.stateChanged.connect(self.on_filter_changed)
-            self.filters[linter] = checkbox
+            self._filter_group.addButton(checkbox, bit)
+            checkboxes.append(checkbox)
             filter_layout.addWidget(checkbox)
 
+        # Parallel to _LINTERS
+        self._cbs = tuple(checkboxes)
+
+        self._filter_group.buttonToggled.connect(self.on_filter_changed)
+
         filter_layout.addStretch()
         parent_layout.addWidget(filter_widget)
 
     def create_log_area(self, parent_layout):
         """Create the main log text area"""
-        self.text_logs = QTextEdit()
+        # QPlainTextEdit appends one block per line and discards the oldest
+        # blocks once maximumBlockCount is reached, so appends stay O(1)
+        self.text_logs = QPlainTextEdit()
         self.text_logs.setReadOnly(True)
-        self.text_logs.setAcceptRichText(True)
+        self.text_logs.setUndoRedoEnabled(False)  # Read-only log needs no undo
+        self.text_logs.setMaximumBlockCount(self._max_lines)
         self.text_logs.setPlaceholderText(
             "Logs will appear here when linting starts..."
         )
 
+        # Appends go straight to the document so the widget's own cursor is
+        # never moved (no cursor/selection signals per flush)
+        self._doc = self.text_logs.document()
+
+        # Cached once; used on every flush for auto-scroll
+        self._vbar = self.text_logs.verticalScrollBar()
+
         # Set monospace font with better sizing and readability
         font = QFont()
         font.setFamilies(["Consolas", "DejaVu Sans Mono", "Menlo", "monospace"])
@@ -131,7 +209,7 @@ class LogViewer(QWidget):
 
         # Enable word wrap for better layout
         self.text_logs.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-        self.text_logs.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self.text_logs.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
 
         # Set object name for CSS targeting
         self.text_logs.setObjectName("logTextArea")
@@ -178,7 +256,7 @@ class LogViewer(QWidget):
         """Apply consistent styling that respects themes"""
         self.setStyleSheet(
             """
-            QTextEdit#logTextArea {
+            QPlainTextEdit#logTextArea {
                 background-color: palette(base);
                 color: palette(text);
                 border: 1px solid palette(mid);
@@ -219,6 +297,7 @@ class LogViewer(QWidget):
                 border-color: palette(highlight);
             }
         """
+            + _FILTER_STYLESHEET
         )
 
     # --- PUBLIC METHODS ---
@@ -228,57 +307,65 @@ class LogViewer(QWidget):
         """
         Append HTML content to the log viewer.
 
+        The log is append-only: fragments are only ever inserted at the end
+        of the document, so existing blocks keep their layout and each flush
+        lays out just the new block. Never setHtml() or insert in the middle
+        of the document - that invalidates the layout of every block.
+
         Args:
             html_fragment: HTML string to append (from structlog + Rich)
         """
-        # Manage line count to prevent memory issues
-        if self._line_count >= self._max_lines:
-            self.trim_logs()
-
-        # Wrap in div with margin for separation
-        wrapped_html = (
-            f'<div style="margin-bottom: 4px; line-height: 1.2;">{html_fragment}</div>'
-        )
-
-        # Move cursor to end and insert HTML
-        cursor = self.text_logs.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.text_logs.setTextCursor(cursor)
-        self.text_logs.insertHtml(wrapped_html)
-
-        # Add newline for proper separation
-        self.text_logs.insertPlainText("\n")
-
-        # Update line count
-        self._line_count += 1
-        self.line_count_label.setText(f"Lines: {self._line_count}")
+        # Queue for the next flush (wrapped there); the timer is armed once
+        # per batch
+        self._pending_html.append(html_fragment)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot(int, str)
+    def append_record(self, level, escaped_text):
+        """
+        Append a log record colored by its level.
 
-        # Auto-scroll if enabled
-        if self._auto_scroll:
-            self.scroll_to_bottom()
+        Args:
+            level: One of the LOG_* levels
+            escaped_text: Message text, already HTML-escaped by the producer
+        """
+        self._pending_html.append(_LEVEL_PREFIX[level] + escaped_text + _SPAN_CLOSE)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def append_plain(self, text):
         """Append plain text (fallback for non-HTML logs)"""
-        self.text_logs.append(text)
-        self._line_count += 1
+        self._flush_pending()
+        was_at_bottom = self._is_at_bottom()
+        self.text_logs.appendPlainText(text)
+        self._html_buffer.append(html.escape(text))
+        self._line_count = min(self._line_count + 1, self._max_lines)
         self.line_count_label.setText(f"Lines: {self._line_count}")
 
-        if self._auto_scroll:
+        if self._auto_scroll and was_at_bottom:
             self.scroll_to_bottom()
 
     def clear_logs(self):
         """Clear all log content"""
+        self._flush_timer.stop()
+        self._pending_html.clear()
+        self._html_buffer.clear()
         self.text_logs.clear()
         self._line_count = 0
         self.line_count_label.setText("Lines: 0")
 
     def get_plain_text(self):
         """Get log content as plain text"""
+        self._flush_pending()
         return self.text_logs.toPlainText()
 
     def get_html(self):
-        """Get log content as HTML"""
-        return self.text_logs.toHtml()
+        """Get log content as HTML (one div per log line)"""
+        self._flush_pending()
+        if not self._html_buffer:
+            return ""
+        return _DIV_OPEN + _DIV_SEPARATOR.join(self._html_buffer) + _DIV_CLOSE
 
     def set_auto_scroll(self, enabled):
         """Enable/disable auto-scrolling"""
@@ -287,43 +374,84 @@ class LogViewer(QWidget):
 
     def scroll_to_bottom(self):
         """Scroll to bottom of log"""
-        scrollbar = self.text_logs.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._vbar.setValue(self._vbar.maximum())
+
+    def get_active_filters(self):
+        """Get the names of the linters whose logs are shown"""
+        return [name for name, cb in zip(self._LINTERS, self._cbs) if cb.isChecked()]
+
+    def set_filter_state(self, linter, enabled):
+        """Show or hide logs from a linter (e.g. "ruff")"""
+        index = self._LINTER_INDEX.get(linter.lower())
+        if index is not None:
+            self._cbs[index].setChecked(enabled)
+
+    def filter_mask(self):
+        """Get the enabled linters as a bitmask of LINTER_* flags"""
+        return self._filter_mask
+
+    def matches(self, mask):
+        """Check whether logs tagged with the given LINTER_* bits are shown"""
+        return bool(self._filter_mask & mask)
 
     def set_max_lines(self, max_lines):
         """Set maximum number of lines to keep in memory"""
         self._max_lines = max_lines
+        self.text_logs.setMaximumBlockCount(max_lines)
+        self._html_buffer = deque(self._html_buffer, maxlen=max_lines)
+        self._line_count = min(self._line_count, max_lines)
 
     # --- PRIVATE METHODS ---
 
-    def trim_logs(self):
-        """Remove old log entries to prevent memory issues"""
-        # Keep only the last 75% of max_lines
-        keep_lines = int(self._max_lines * 0.75)
+    @Slot()
+    def _flush_pending(self):
+        """Append all queued HTML fragments in a single document update"""
+        if not self._pending_html:
+            return
+
+        batch = self._pending_html
+        self._pending_html = []
+        self._html_buffer.extend(batch)
+        was_at_bottom = self._is_at_bottom()
+
+        # Suspend painting so the whole batch produces a single repaint
+        self.text_logs.setUpdatesEnabled(False)
+        try:
+            # Append-only: always write at End (see append_html). The cursor
+            # is local to the document and never handed to setTextCursor(),
+            # which would emit cursor/selection signals and scroll the view.
+            cursor = QTextCursor(self._doc)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            if not self._doc.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(_DIV_OPEN + _DIV_SEPARATOR.join(batch) + _DIV_CLOSE)
+        finally:
+            self.text_logs.setUpdatesEnabled(True)
 
-        text = self.text_logs.toPlainText()
-        lines = text.split("\n")
+        # Update line count
+        self._line_count = min(self._line_count + len(batch), self._max_lines)
+        self.line_count_label.setText(f"Lines: {self._line_count}")
 
-        if len(lines) > keep_lines:
-            # Keep the most recent lines
-            trimmed_lines = lines[-keep_lines:]
-            self.text_logs.clear()
-            self.text_logs.setPlainText("\n".join(trimmed_lines))
-            self._line_count = len(trimmed_lines)
+        # Auto-scroll only if the user was already following the tail
+        if self._auto_scroll and was_at_bottom:
+            self.scroll_to_bottom()
+
+    def _is_at_bottom(self):
+        """Check whether the log is scrolled to (or within a few px of) the end"""
+        return self._vbar.value() >= self._vbar.maximum() - 4
 
     # --- SLOT IMPLEMENTATIONS ---
 
-    @Slot(int)
-    def on_filter_changed(self, state):
+    @Slot(QAbstractButton, bool)
+    def on_filter_changed(self, button, checked):
         """Handle filter checkbox state change"""
-        # TODO: Implement log filtering based on linter type
-        # This would require tagging log entries with their source linter
-        sender = self.sender()
-        if sender:
-            linter_name = sender.text()
-            enabled = state == Qt.CheckState.Checked.value
-            # For now, just update the UI state
-            # Real filtering would need cooperation with the logging system
+        # The button id is the linter's LINTER_* bit
+        bit = self._filter_group.id(button)
+        if checked:
+            self._filter_mask |= bit
+        else:
+            self._filter_mask &= ~bit
+        self.filterChanged.emit(self._filter_mask)
 
     @Slot(int)
     def on_auto_scroll_changed(self, state):
@@ -343,8 +471,7 @@ class LogViewer(QWidget):
 
         # If user scrolls up, disable auto-scroll temporarily
         if event.angleDelta().y() > 0:  # Scrolling up
-            scrollbar = self.text_logs.verticalScrollBar()
-            if scrollbar.value() < scrollbar.maximum() - 10:
+            if self._vbar.value() < self._vbar.maximum() - 10:
                 # User is not at bottom, disable auto-scroll
                 if self._auto_scroll:
                     self.set_auto_scroll(False)
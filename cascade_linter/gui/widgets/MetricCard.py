@@ -1,8 +1,91 @@
 # cascade_linter/gui/widgets/MetricCard.py
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from PySide6.QtCore import (
+    Qt,
+    QEvent,
+    QPropertyAnimation,
+    QAbstractAnimation,
+    QEasingCurve,
+    Property,
+)
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
+
+
+# Accent colors selectable through set_card_type
+CARD_TYPE_COLORS = {
+    "info": "#3498db",
+    "success": "#27ae60",
+    "warning": "#f39c12",
+    "error": "#e74c3c",
+}
+
+# Shared card stylesheet. Accents are chosen with the cardType dynamic
+# property, so changing type re-polishes instead of re-parsing a new sheet.
+_CARD_STYLESHEET = (
+    """
+    MetricCard {
+        border: 1px solid palette(mid);
+        border-radius: 8px;
+        background-color: palette(base);
+    }
+    QLabel#metricValue {
+        font-size: 24pt;
+        font-weight: bold;
+        background: none;
+        border: none;
+        margin-top: 4px;
+    }
+"""
+    + "".join(
+        f"""
+    MetricCard[cardType="{card_type}"] {{
+        border-color: {color};
+    }}
+    MetricCard[cardType="{card_type}"] QLabel#metricValue {{
+        color: {color};
+    }}
+"""
+        for card_type, color in CARD_TYPE_COLORS.items()
+    )
+    + """
+    MetricCard:hover {
+        border: 2px solid palette(highlight);
+        background-color: palette(alternate-base);
+    }
+    MetricCard QLabel#metricValue[loading="true"] {
+        font-size: 18pt;
+        color: palette(mid);
+    }
+"""
+)
+
+# Side of the square icon area, in device-independent pixels
+ICON_SIZE = 24
+
+# Changes that alter the icon's text color
+_ICON_THEME_EVENTS = (QEvent.Type.PaletteChange, QEvent.Type.StyleChange)
+
+
+@lru_cache(maxsize=None)
+def _icon_pixmap(icon, size, dpr, color):
+    """Rasterize an emoji/text icon once; every card showing it shares the pixmap"""
+    pixmap = QPixmap(round(size * dpr), round(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    font = QFont()
+    font.setPixelSize(round(size * 0.8))
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, icon)
+    painter.end()
+    return pixmap
 
 
 class MetricCard(QWidget):
@@ -17,15 +100,23 @@ class MetricCard(QWidget):
     - Follows Nielsen's heuristics for clear information display
     """
 
-    def __init__(self, title="Metric", value=0, icon="📊", parent=None):
+    def __init__(self, title="Metric", value=0, icon="📊", parent=None, card_type=None):
         super().__init__(parent)
         self.setFixedSize(200, 100)
 
+        # Let the stylesheet paint the card background and hover border
+        # (plain QWidget subclasses skip QSS backgrounds otherwise)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+
         # Data
         self._title = title
         self._icon = icon
+        self._card_type = card_type
         self._value = value
-        self._animated_value = float(value)
+        self._animated_value = float(value) if isinstance(value, (int, float)) else 0.0
+        self._last_shown = int(round(self._animated_value))
+        self._icon_key = None  # (icon, dpr, color) of the pixmap on show
+        self._window_handle = None  # Window whose screen changes we follow
 
         # Animation
         self._animation = QPropertyAnimation(self, b"animatedValue")
@@ -33,6 +124,7 @@ class MetricCard(QWidget):
         self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
         # Setup UI
+        self.setProperty("cardType", card_type or "")
         self.init_ui()
         self.apply_styling()
 
@@ -46,19 +138,19 @@ class MetricCard(QWidget):
         top_layout = QHBoxLayout()
         top_layout.setSpacing(8)
 
-        # Icon label
-        self.icon_label = QLabel(self._icon)
+        # Icon label (shows a cached pixmap instead of shaping the glyph)
+        self.icon_label = QLabel()
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setFixedSize(24, 24)
+        self.icon_label.setFixedSize(ICON_SIZE, ICON_SIZE)
         self.icon_label.setStyleSheet(
             """
             QLabel {
-                font-size: 16pt;
                 background: none;
                 border: none;
             }
         """
         )
+        self._update_icon_pixmap()
         top_layout.addWidget(self.icon_label)
 
         # Title label
@@ -84,78 +176,64 @@ class MetricCard(QWidget):
         self.value_label = QLabel(str(self._value))
         self.value_label.setObjectName("metricValue")
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.value_label.setStyleSheet(
-            """
-            QLabel#metricValue {
-                font-size: 24pt;
-                font-weight: bold;
-                background: none;
-                border: none;
-                margin-top: 4px;
-            }
-        """
-        )
+        self.value_label.setProperty("loading", "false")
         layout.addWidget(self.value_label, stretch=1)
 
     def apply_styling(self):
         """Apply card-like styling that respects themes"""
-        self.setStyleSheet(
-            """
-            MetricCard {
-                border: 1px solid palette(mid);
-                border-radius: 8px;
-                background-color: palette(base);
-            }
-            MetricCard:hover {
-                border: 2px solid palette(highlight);
-                background-color: palette(alternate-base);
-            }
-        """
-        )
+        self.setStyleSheet(_CARD_STYLESHEET)
+
+    def set_card_type(self, card_type):
+        """Set the accent type ("info", "success", "warning", "error" or None)"""
+        self._card_type = card_type
+        self.setProperty("cardType", card_type or "")
+
+        # Re-resolve the already-parsed rules for the new property value
+        for widget in (self, self.value_label):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def get_card_type(self):
+        """Get the accent type"""
+        return self._card_type
 
     def set_loading_state(self, is_loading=True):
         """Set the card to show loading state instead of static zeros"""
         if is_loading:
             self.value_label.setText("...")
-            self.value_label.setStyleSheet(
-                """
-                QLabel#metricValue {
-                    font-size: 18pt;
-                    font-weight: bold;
-                    background: none;
-                    border: none;
-                    margin-top: 4px;
-                    color: palette(mid);
-                }
-            """
-            )
-        else:
-            # Restore normal styling
-            self.value_label.setStyleSheet(
-                """
-                QLabel#metricValue {
-                    font-size: 24pt;
-                    font-weight: bold;
-                    background: none;
-                    border: none;
-                    margin-top: 4px;
-                }
-            """
-            )
+            self._last_shown = None  # Next animation step must redraw
+
+        # Toggle the loading rule of the card stylesheet (no re-parse)
+        self.value_label.setProperty("loading", "true" if is_loading else "false")
+        self.value_label.style().unpolish(self.value_label)
+        self.value_label.style().polish(self.value_label)
 
     def set_value(self, value):
         """Set the metric value with smooth animation"""
         if value == self._value:
             return
+        if (
+            self._animation.state() == QAbstractAnimation.State.Running
+            and self._animation.endValue() == float(value)
+        ):
+            return
 
-        old_value = self._value
         self._value = value
 
-        # Animate value change
-        self._animation.setStartValue(float(old_value))
+        # Restart from the currently displayed value so an in-flight
+        # animation is retargeted instead of jumping back
+        self._animation.stop()
+        self._animation.setStartValue(self._animated_value)
         self._animation.setEndValue(float(value))
         self._animation.start()
 
+    def update_value(self, text):
+        """Show a preformatted value (e.g. "1.2s") without animating"""
+        self._animation.stop()
+        self._value = text
+        self._last_shown = None
+        self.value_label.setText(str(text))
+
     def get_value(self):
         """Get the current metric value"""
         return self._value
@@ -172,12 +250,44 @@ class MetricCard(QWidget):
     def set_icon(self, icon):
         """Set the metric icon"""
         self._icon = icon
-        self.icon_label.setText(icon)
+        self._update_icon_pixmap()
 
     def get_icon(self):
         """Get the metric icon"""
         return self._icon
 
+    def _update_icon_pixmap(self):
+        """Show the cached pixmap for the current icon, color and pixel ratio"""
+        color = self.palette().windowText().color().name()
+        key = (self._icon, self.devicePixelRatioF(), color)
+        if key == self._icon_key:
+            return
+        self._icon_key = key
+        self.icon_label.setPixmap(_icon_pixmap(self._icon, ICON_SIZE, key[1], color))
+
+    def changeEvent(self, event):
+        """Re-rasterize the icon when the theme changes"""
+        # Style changes also arrive from __init__, before the icon label exists
+        if event.type() in _ICON_THEME_EVENTS and hasattr(self, "icon_label"):
+            self._update_icon_pixmap()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        """Match the icon to the screen the card is shown on"""
+        super().showEvent(event)
+
+        # Follow moves to other screens, which may have another pixel ratio
+        handle = self.window().windowHandle()
+        if handle is not None and handle is not self._window_handle:
+            handle.screenChanged.connect(self._on_screen_changed)
+            self._window_handle = handle
+
+        self._update_icon_pixmap()
+
+    def _on_screen_changed(self, screen):
+        """Re-rasterize the icon for the new screen's pixel ratio"""
+        self._update_icon_pixmap()
+
     # Property for animation
     @Property(float)
     def animatedValue(self):
@@ -186,36 +296,13 @@ class MetricCard(QWidget):
     @animatedValue.setter
     def animatedValue(self, value):
         self._animated_value = value
-        # Update display with animated value
+        # Update display only when the visible integer changes
         display_value = int(round(value))
+        if display_value == self._last_shown:
+            return
+        self._last_shown = display_value
         self.value_label.setText(str(display_value))
 
-    def paintEvent(self, event):
-        """Custom paint event for additional visual effects"""
-        super().paintEvent(event)
-
-        # Optional: Add subtle glow effect when hovered
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Check if widget is under mouse
-        if self.underMouse():
-            # Draw subtle glow
-            glow_color = QColor(114, 159, 207, 30)  # Semi-transparent blue
-            pen = QPen(glow_color, 2)
-            painter.setPen(pen)
-            painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 8, 8)
-
-    def enterEvent(self, event):
-        """Handle mouse enter for hover effects"""
-        super().enterEvent(event)
-        self.update()  # Trigger repaint for glow effect
-
-    def leaveEvent(self, event):
-        """Handle mouse leave for hover effects"""
-        super().leaveEvent(event)
-        self.update()  # Trigger repaint to remove glow
-
     def sizeHint(self):
         """Provide size hint for layout managers"""
         from PySide6.QtCore import QSize
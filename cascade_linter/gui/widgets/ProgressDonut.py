@@ -1,9 +1,231 @@
 # cascade_linter/gui/widgets/ProgressDonut.py
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QTimer
-from PySide6.QtGui import QPainter, QColor, QPen, QFont, QBrush
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QTimer, QRectF, QPointF, QSize
+from PySide6.QtGui import (
+    QPainter,
+    QColor,
+    QPen,
+    QFont,
+    QBrush,
+    QPixmap,
+    QPolygonF,
+    QStaticText,
+    QTransform,
+)
 import math
+import time
+import weakref
+
+# Width of the ring between the outer circle and the inner hole
+RING_WIDTH = 15
+
+# Progress arc start in degrees, counter-clockwise from 3 o'clock like
+# QPainter.drawArc (bottom of circle)
+ARC_START_ANGLE = -90
+
+# Unit-circle vertices of the progress arc, one per percent (3.6 degrees
+# apart). Screen y points down, hence the negated sine.
+_UNIT_ARC = tuple(
+    (
+        math.cos(math.radians(ARC_START_ANGLE + 3.6 * i)),
+        -math.sin(math.radians(ARC_START_ANGLE + 3.6 * i)),
+    )
+    for i in range(101)
+)
+
+# Default palette (matching dark theme). Colors are only ever replaced, never
+# modified in place, so every donut can share these instances.
+DEFAULT_BACKGROUND_COLOR = QColor("#555753")
+DEFAULT_PROGRESS_COLOR = QColor("#729fcf")  # Blue accent
+DEFAULT_TEXT_COLOR = QColor("#eeeeec")
+DEFAULT_BORDER_COLOR = QColor("#888a85")
+_HOLE_COLOR = QColor("#2e3436")  # Match main window background
+
+# Hover styling, shared by every ProgressDonut
+_DONUT_STYLESHEET = """
+    ProgressDonut {
+        background: transparent;
+    }
+    ProgressDonut:hover {
+        background: rgba(114, 159, 207, 0.1);
+        border-radius: 40px;
+    }
+"""
+
+# Progress animation timing
+ANIMATION_DURATION = 0.5  # Seconds - slightly longer for smooth feel
+TICK_INTERVAL_MS = 16  # ~60 Hz
+
+
+def _snap(value, dpr):
+    """Round a logical coordinate to a whole number of device pixels"""
+    return round(value * dpr) / dpr
+
+
+def _color_with_alpha(color, alpha):
+    """Get a copy of a QColor with the given alpha"""
+    color = QColor(color)
+    color.setAlpha(alpha)
+    return color
+
+
+def _donut_geometry(x, y, width, height, dpr):
+    """
+    Lay out a donut centered in the given box.
+
+    Edges are snapped to whole device pixels so fractional scale factors
+    (125%, 150%) don't put the circles on sub-pixel offsets.
+
+    Returns:
+        (donut_rect, inner_rect, arc_rect, percent_rect) as QRectF
+    """
+    size = _snap(min(width, height) - 8, dpr)  # Leave margin
+    left = _snap(x + (width - size) / 2, dpr)
+    top = _snap(y + (height - size) / 2, dpr)
+    donut_rect = QRectF(left, top, size, size)
+
+    ring = _snap(RING_WIDTH, dpr)
+    inner_rect = donut_rect.adjusted(ring, ring, -ring, -ring)
+
+    # Progress arc runs along the middle of the ring, the percentage sits
+    # just below the title
+    half_ring = RING_WIDTH / 2
+    arc_rect = donut_rect.adjusted(half_ring, half_ring, -half_ring, -half_ring)
+    percent_rect = inner_rect.adjusted(0, 6, 0, 6)
+    return donut_rect, inner_rect, arc_rect, percent_rect
+
+
+def _draw_donut_base(painter, donut_rect, inner_rect, title, font, colors):
+    """
+    Draw the static part of a donut: the circles and the title.
+
+    Args:
+        painter: Active QPainter to draw with
+        donut_rect: Outer circle rect
+        inner_rect: Inner hole rect
+        title: Title text drawn in the hole
+        font: Title font
+        colors: (background, text, border) QColors
+    """
+    background, text, border = colors
+
+    # Background circle
+    painter.setPen(QPen(border, 2))
+    painter.setBrush(QBrush(background))
+    painter.drawEllipse(donut_rect)
+
+    # Inner circle to create donut effect
+    painter.setPen(QPen(background, 1))
+    painter.setBrush(QBrush(_HOLE_COLOR))
+    painter.drawEllipse(inner_rect)
+
+    # Move title up slightly to make room for percentage. The title is only
+    # shaped when a cached layer is rebuilt; paint blits the result.
+    painter.setPen(QPen(text))
+    painter.setFont(font)
+    title_rect = inner_rect.adjusted(0, -6, 0, -6)
+    painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, title)
+
+
+def _arc_points(arc_rect):
+    """Get the progress arc vertices for a donut, one QPointF per percent"""
+    center = arc_rect.center()
+    cx, cy = center.x(), center.y()
+    radius = arc_rect.width() / 2
+    return [QPointF(cx + radius * x, cy + radius * y) for x, y in _UNIT_ARC]
+
+
+def _donut_dirty_rect(donut_rect):
+    """
+    Get the widget area repainted when a donut's progress changes.
+
+    The arc fills the ring and the percentage sits in the hole, so this is
+    the donut itself plus a pixel for antialiasing.
+    """
+    return donut_rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+
+
+def _percent_static_text(font):
+    """Create a QStaticText for a donut percentage, laid out for 0%"""
+    static_text = QStaticText()
+    static_text.setTextFormat(Qt.TextFormat.PlainText)
+    static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+    _set_percent_text(static_text, 0, font)
+    return static_text
+
+
+def _set_percent_text(static_text, percent, font):
+    """Re-lay out a percentage QStaticText; done only when the percent changes"""
+    static_text.setText(f"{percent}%")
+    static_text.prepare(QTransform(), font)
+
+
+def _centered_text_pos(static_text, rect):
+    """Get the top-left position that centers a QStaticText in a rect"""
+    size = static_text.size()
+    center = rect.center()
+    return QPointF(center.x() - size.width() / 2, center.y() - size.height() / 2)
+
+
+def _eased_progress(anim, now):
+    """
+    Evaluate a progress animation at the given time.
+
+    Args:
+        anim: (start_time, start_value, end_value)
+        now: time.monotonic() timestamp
+
+    Returns:
+        (value, finished)
+    """
+    start_time, start, end = anim
+    t = min(1.0, (now - start_time) / ANIMATION_DURATION)
+    eased = 1.0 - (1.0 - t) ** 3  # OutCubic
+    return start + (end - start) * eased, t >= 1.0
+
+
+class _DonutTickGroup:
+    """
+    Drives the progress animation of every donut widget from one shared
+    timer, so all animating donuts advance in a single wakeup per frame.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Get the shared tick group, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._donuts = weakref.WeakSet()
+        self._timer = QTimer()
+        self._timer.setInterval(TICK_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def add(self, donut):
+        """Start ticking a donut until its animation finishes"""
+        self._donuts.add(donut)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _tick(self):
+        """Advance every animating donut, dropping the finished ones"""
+        now = time.monotonic()
+        for donut in list(self._donuts):
+            try:
+                finished = donut._advance_animation(now)
+            except RuntimeError:
+                # The C++ widget was deleted while its wrapper lives on
+                finished = True
+            if finished:
+                self._donuts.discard(donut)
+
+        if not self._donuts:
+            self._timer.stop()
 
 
 class ProgressDonut(QWidget):
@@ -27,69 +249,96 @@ class ProgressDonut(QWidget):
         self._title = title
         self._progress = 0
         self._animated_progress = 0.0
+        self._shown_percent = 0  # Integer percent currently drawn
+        self._arc_poly = None  # Arc polyline for the drawn percent, built lazily
 
         # Colors (matching dark theme)
-        self._background_color = QColor("#555753")
-        self._progress_color = QColor("#729fcf")  # Blue accent
-        self._text_color = QColor("#eeeeec")
-        self._border_color = QColor("#888a85")
-
-        # Animation
-        self._animation = QPropertyAnimation(self, b"animatedProgress")
-        self._animation.setDuration(500)  # Slightly longer for smooth feel
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        # Setup UI
-        self.init_ui()
-        self.apply_styling()
+        self._background_color = DEFAULT_BACKGROUND_COLOR
+        self._progress_color = DEFAULT_PROGRESS_COLOR
+        self._text_color = DEFAULT_TEXT_COLOR
+        self._border_color = DEFAULT_BORDER_COLOR
+
+        # Fonts, created once instead of on every paint
+        self._title_font = QFont("Segoe UI", 7, QFont.Weight.Bold)
+        self._pct_font = QFont("Segoe UI", 8, QFont.Weight.Bold)
+
+        # Percentage glyphs are laid out once per percent, not per paint
+        self._pct_static = _percent_static_text(self._pct_font)
+        self._pct_pos = None  # Built lazily from the text size and geometry
+
+        # Pre-rendered static layer (circles and title) and the paint
+        # geometry, rebuilt on resize/title/color changes
+        self._bg_cache = None
+        self._arc_points = None
+        self._percent_rect = None
+        self._dirty_rect = None  # Area touched by the arc and percentage
+
+        # Pens used on every paint, built once and recolored by set_colors.
+        # Progress is a stroked arc filling the ring, drawn slightly
+        # transparent for better appearance.
+        self._arc_pen = QPen(
+            _color_with_alpha(self._progress_color, 220),
+            RING_WIDTH,
+            Qt.PenStyle.SolidLine,
+            Qt.PenCapStyle.FlatCap,
+        )
+        # Percentage in full progress color when active, dimmed text at 0
+        self._pct_pen_on = QPen(_color_with_alpha(self._progress_color, 255))
+        self._pct_pen_off = QPen(_color_with_alpha(self._text_color, 150))
+        self._pct_pen = self._pct_pen_off
 
-    def init_ui(self):
-        """Initialize the user interface"""
-        # We'll draw everything in paintEvent, so just set up the layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
+        # Running animation as (start_time, start_value, end_value), advanced
+        # by the shared _DonutTickGroup
+        self._anim = None
 
-        # Optional: Add a tooltip
+        # Latest set_progress target, applied once per event-loop pass
+        self._pending_target = None
+        self._coalesce_scheduled = False
+
+        # Everything is drawn in paintEvent, so there is no layout
         self.setToolTip(f"{self._title} linter progress")
+        self.apply_styling()
 
     def apply_styling(self):
         """Apply styling for hover effects"""
-        self.setStyleSheet(
-            """
-            ProgressDonut {
-                background: transparent;
-            }
-            ProgressDonut:hover {
-                background: rgba(114, 159, 207, 0.1);
-                border-radius: 40px;
-            }
-        """
-        )
+        self.setStyleSheet(_DONUT_STYLESHEET)
 
     def set_progress(self, progress):
         """Set the progress value with smooth animation (0-100)"""
         progress = max(0, min(100, progress))  # Clamp to 0-100
 
+        # Coalesce bursts of updates into a single animation restart
+        self._pending_target = progress
+        if not self._coalesce_scheduled:
+            self._coalesce_scheduled = True
+            QTimer.singleShot(0, self._apply_pending)
+
+    def _apply_pending(self):
+        """Animate towards the last progress value set since the last pass"""
+        progress = self._pending_target
+        self._pending_target = None
+        self._coalesce_scheduled = False
+
         if progress == self._progress:
             return
 
-        old_progress = self._progress
         self._progress = progress
 
-        # Animate progress change
-        self._animation.setStartValue(float(old_progress))
-        self._animation.setEndValue(float(progress))
-        self._animation.start()
+        # Animate from wherever the previous animation got to
+        self._anim = (time.monotonic(), self._animated_progress, float(progress))
+        _DonutTickGroup.instance().add(self)
 
     def get_progress(self):
         """Get the current progress value"""
+        if self._pending_target is not None:
+            return self._pending_target
         return self._progress
 
     def set_title(self, title):
         """Set the donut title"""
         self._title = title
         self.setToolTip(f"{self._title} linter progress")
-        self.update()
+        self._invalidate_cache()
 
     def get_title(self):
         """Get the donut title"""
@@ -97,113 +346,134 @@ class ProgressDonut(QWidget):
 
     def set_colors(self, background=None, progress=None, text=None, border=None):
         """Set custom colors for the donut"""
-        if background:
-            self._background_color = QColor(background)
         if progress:
             self._progress_color = QColor(progress)
+            self._arc_pen.setColor(_color_with_alpha(self._progress_color, 220))
+            self._pct_pen_on.setColor(_color_with_alpha(self._progress_color, 255))
+        if background:
+            self._background_color = QColor(background)
         if text:
             self._text_color = QColor(text)
+            self._pct_pen_off.setColor(_color_with_alpha(self._text_color, 150))
         if border:
             self._border_color = QColor(border)
-        self.update()
 
-    # Property for animation
-    @Property(float)
-    def animatedProgress(self):
-        return self._animated_progress
+        # The progress color is not part of the cached layer
+        if background or text or border:
+            self._invalidate_cache()
+        else:
+            self.update()
 
-    @animatedProgress.setter
-    def animatedProgress(self, value):
+    def _advance_animation(self, now):
+        """
+        Step the progress animation to the given time.
+
+        Returns:
+            True when the animation has finished
+        """
+        value, finished = _eased_progress(self._anim, now)
         self._animated_progress = value
-        self.update()  # Trigger repaint
+        if finished:
+            self._anim = None
+
+        # Only repaint when the drawn integer percent changes
+        percent = int(value)
+        if percent != self._shown_percent:
+            self._shown_percent = percent
+            _set_percent_text(self._pct_static, percent, self._pct_font)
+            self._pct_pos = None
+            self._arc_poly = None
+            self._pct_pen = self._pct_pen_on if percent > 0 else self._pct_pen_off
+            if self._dirty_rect is None:
+                self.update()
+            else:
+                self.update(self._dirty_rect)
+
+        return finished
+
+    def _invalidate_cache(self):
+        """Drop the static layer so the next paint re-renders it"""
+        self._bg_cache = None
+        self.update()
+
+    def _rebuild_bg_cache(self):
+        """Render the static circles and title into the cached pixmap"""
+        dpr = self.devicePixelRatioF()
+        donut_rect, inner_rect, arc_rect, self._percent_rect = _donut_geometry(
+            0, 0, self.width(), self.height(), dpr
+        )
+        self._arc_points = _arc_points(arc_rect)
+        self._arc_poly = None
+        self._pct_pos = None
+        self._dirty_rect = _donut_dirty_rect(donut_rect)
+
+        # Match the screen's pixel density so the blit is a 1:1 copy
+        self._bg_cache = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        self._bg_cache.setDevicePixelRatio(dpr)
+        self._bg_cache.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._bg_cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _draw_donut_base(
+            painter,
+            donut_rect,
+            inner_rect,
+            self._title,
+            self._title_font,
+            (self._background_color, self._text_color, self._border_color),
+        )
+        painter.end()
+
+    def resizeEvent(self, event):
+        """Invalidate the cached layers when the size changes"""
+        super().resizeEvent(event)
+        self._invalidate_cache()
 
     def paintEvent(self, event):
         """Custom paint event to draw the donut"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.paint(painter)
 
-        # Get the square area for the donut
-        rect = self.rect()
-        size = min(rect.width(), rect.height()) - 8  # Leave margin
-        x = (rect.width() - size) // 2
-        y = (rect.height() - size) // 2
-        donut_rect = rect.adjusted(x, y, -x, -y)
-
-        # Draw background circle
-        painter.setPen(QPen(self._border_color, 2))
-        painter.setBrush(QBrush(self._background_color))
-        painter.drawEllipse(donut_rect)
-
-        # Draw progress arc
-        if self._animated_progress > 0:
-            # Calculate the arc span (360 degrees = full circle)
-            span_angle = int(
-                (self._animated_progress / 100.0) * 360 * 16
-            )  # Qt uses 16ths of degrees
-
-            # Create progress color with slight transparency for better appearance
-            progress_color = QColor(self._progress_color)
-            progress_color.setAlpha(220)
-
-            # Draw the progress arc
-            painter.setPen(QPen(progress_color, 3))
-            painter.setBrush(QBrush(progress_color))
-
-            # Start from top (-90 degrees) and go clockwise
-            start_angle = -90 * 16  # Top of circle
-            painter.drawPie(donut_rect, start_angle, span_angle)
-
-        # Draw inner circle to create donut effect
-        inner_margin = 15
-        inner_rect = donut_rect.adjusted(
-            inner_margin, inner_margin, -inner_margin, -inner_margin
-        )
-        painter.setPen(QPen(self._background_color, 1))
-        painter.setBrush(QBrush(QColor("#2e3436")))  # Match main window background
-        painter.drawEllipse(inner_rect)
-
-        # Draw title text in center
-        painter.setPen(QPen(self._text_color))
-        font = QFont("Segoe UI", 7, QFont.Weight.Bold)  # Slightly larger font
-        painter.setFont(font)
-
-        # Calculate text position - move title up slightly to make room for percentage
-        title_rect = inner_rect.adjusted(0, -6, 0, -6)  # Move up
-        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self._title)
-
-        # Draw percentage text below title with better visibility
-        # Always show percentage, even when 0
-        percentage_text = f"{int(self._animated_progress)}%"
-
-        # Use larger, bold font for percentage
-        font_percent = QFont("Segoe UI", 8, QFont.Weight.Bold)
-        painter.setFont(font_percent)
-
-        # Use progress color when active, dimmed text color when at 0
-        if self._animated_progress > 0:
-            bright_color = QColor(self._progress_color)
-            bright_color.setAlpha(255)  # Full opacity
-            painter.setPen(QPen(bright_color))
-        else:
-            # Use dimmed text color for 0%
-            dim_color = QColor(self._text_color)
-            dim_color.setAlpha(150)  # Slightly dimmed
-            painter.setPen(QPen(dim_color))
+    def paint(self, painter):
+        """
+        Paint the donut in widget coordinates.
+
+        Kept separate from paintEvent so the donut can be drawn onto any
+        QPainter target, not just the widget itself.
 
-        # Position percentage below title
-        percent_rect = inner_rect.adjusted(0, 6, 0, 6)  # Move down
-        painter.drawText(percent_rect, Qt.AlignmentFlag.AlignCenter, percentage_text)
+        Args:
+            painter: Active QPainter to draw with
+        """
+        if (
+            self._bg_cache is None
+            or self._bg_cache.devicePixelRatio() != self.devicePixelRatioF()
+        ):
+            self._rebuild_bg_cache()
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._bg_cache)
+
+        # Draw progress arc as a polyline through the precomputed vertices;
+        # the polygon is only rebuilt when the percent or geometry changes
+        if self._shown_percent > 0:
+            if self._arc_poly is None:
+                self._arc_poly = QPolygonF(self._arc_points[: self._shown_percent + 1])
+            painter.setPen(self._arc_pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPolyline(self._arc_poly)
+
+        # Draw percentage text below title - always shown, even when 0
+        if self._pct_pos is None:
+            self._pct_pos = _centered_text_pos(self._pct_static, self._percent_rect)
+        painter.setFont(self._pct_font)
+        painter.setPen(self._pct_pen)
+        painter.drawStaticText(self._pct_pos, self._pct_static)
 
     def sizeHint(self):
         """Provide size hint for layout managers"""
-        from PySide6.QtCore import QSize
-
         return QSize(80, 80)
 
     def minimumSizeHint(self):
         """Provide minimum size hint"""
-        from PySide6.QtCore import QSize
-
         return QSize(60, 60)
 
     def enterEvent(self, event):
@@ -225,6 +495,210 @@ class ProgressDonut(QWidget):
         self.set_progress(100)
 
 
+class StageDonutStrip(QWidget):
+    """
+    A row of stage progress donuts painted by a single widget.
+
+    Looks like a row of ProgressDonut widgets, but all stages are drawn in
+    one paint pass with shared pens and fonts, and one cached background.
+    """
+
+    DONUT_SIZE = 80
+    STAGE_SPACING = 20
+
+    def __init__(
+        self, titles=("Ruff", "Flake8", "Pylint", "Bandit", "MyPy"), parent=None
+    ):
+        super().__init__(parent)
+
+        self._title_font = QFont("Segoe UI", 7, QFont.Weight.Bold)
+        self._pct_font = QFont("Segoe UI", 8, QFont.Weight.Bold)
+
+        # Per-stage state; "anim" is (start_time, start_value, end_value),
+        # "poly" and "pct_pos" are built lazily at paint time
+        self._stages = [
+            {
+                "title": title,
+                "progress": 0,
+                "animated": 0.0,
+                "percent": 0,
+                "pct_static": _percent_static_text(self._pct_font),
+                "pct_pos": None,
+                "poly": None,
+                "anim": None,
+            }
+            for title in titles
+        ]
+        count = len(self._stages)
+        self.setFixedSize(
+            count * self.DONUT_SIZE + max(count - 1, 0) * self.STAGE_SPACING,
+            self.DONUT_SIZE,
+        )
+
+        # Colors (matching dark theme), shared by every stage
+        self._background_color = DEFAULT_BACKGROUND_COLOR
+        self._progress_color = DEFAULT_PROGRESS_COLOR
+        self._text_color = DEFAULT_TEXT_COLOR
+        self._border_color = DEFAULT_BORDER_COLOR
+
+        self._arc_pen = QPen(
+            _color_with_alpha(self._progress_color, 220),
+            RING_WIDTH,
+            Qt.PenStyle.SolidLine,
+            Qt.PenCapStyle.FlatCap,
+        )
+        self._pct_pen_on = QPen(_color_with_alpha(self._progress_color, 255))
+        self._pct_pen_off = QPen(_color_with_alpha(self._text_color, 150))
+
+        # Cached background and per-stage (dirty_rect, arc_points, percent_rect)
+        self._bg_cache = None
+        self._slots = []
+
+    def set_stage_progress(self, index, progress):
+        """Set a stage's progress value with smooth animation (0-100)"""
+        progress = max(0, min(100, progress))  # Clamp to 0-100
+        stage = self._stages[index]
+        if progress == stage["progress"]:
+            return
+
+        stage["progress"] = progress
+        stage["anim"] = (time.monotonic(), stage["animated"], float(progress))
+        _DonutTickGroup.instance().add(self)
+
+    def get_stage_progress(self, index):
+        """Get a stage's current progress value"""
+        return self._stages[index]["progress"]
+
+    def set_stage_title(self, index, title):
+        """Set a stage's title"""
+        self._stages[index]["title"] = title
+        self._bg_cache = None
+        self.update()
+
+    def stage_count(self):
+        """Get the number of stages"""
+        return len(self._stages)
+
+    def reset(self):
+        """Reset every stage to 0"""
+        for index in range(len(self._stages)):
+            self.set_stage_progress(index, 0)
+
+    def _advance_animation(self, now):
+        """
+        Step every animating stage to the given time.
+
+        Returns:
+            True when no stage is animating any more
+        """
+        running = False
+        for index, stage in enumerate(self._stages):
+            anim = stage["anim"]
+            if anim is None:
+                continue
+
+            value, finished = _eased_progress(anim, now)
+            stage["animated"] = value
+            if finished:
+                stage["anim"] = None
+            else:
+                running = True
+
+            percent = int(value)
+            if percent != stage["percent"]:
+                stage["percent"] = percent
+                _set_percent_text(stage["pct_static"], percent, self._pct_font)
+                stage["pct_pos"] = None
+                stage["poly"] = None
+
+                # Only the stages that moved are repainted; Qt merges the
+                # rects into one paint event
+                if self._slots:
+                    self.update(self._slots[index][0])
+                else:
+                    self.update()
+
+        return not running
+
+    def _rebuild_bg_cache(self):
+        """Render every stage's circles and title into one cached pixmap"""
+        dpr = self.devicePixelRatioF()
+        self._bg_cache = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        self._bg_cache.setDevicePixelRatio(dpr)
+        self._bg_cache.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._bg_cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        colors = (self._background_color, self._text_color, self._border_color)
+        step = self.DONUT_SIZE + self.STAGE_SPACING
+        self._slots = []
+        for index, stage in enumerate(self._stages):
+            donut_rect, inner_rect, arc_rect, percent_rect = _donut_geometry(
+                index * step, 0, self.DONUT_SIZE, self.DONUT_SIZE, dpr
+            )
+            _draw_donut_base(
+                painter,
+                donut_rect,
+                inner_rect,
+                stage["title"],
+                self._title_font,
+                colors,
+            )
+            self._slots.append(
+                (_donut_dirty_rect(donut_rect), _arc_points(arc_rect), percent_rect)
+            )
+            stage["poly"] = None
+            stage["pct_pos"] = None
+        painter.end()
+
+    def resizeEvent(self, event):
+        """Invalidate the cached background when the size changes"""
+        super().resizeEvent(event)
+        self._bg_cache = None
+
+    def paintEvent(self, event):
+        """Draw all stages in a single pass"""
+        if (
+            self._bg_cache is None
+            or self._bg_cache.devicePixelRatio() != self.devicePixelRatioF()
+        ):
+            self._rebuild_bg_cache()
+
+        # The system clip limits the blit to the dirty region; stages outside
+        # it are skipped entirely
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._bg_cache)
+
+        region = event.region()
+        dirty = [
+            (stage, slot)
+            for stage, slot in zip(self._stages, self._slots)
+            if region.intersects(slot[0])
+        ]
+
+        # Arcs share one pen, so it is bound once for the whole row
+        painter.setPen(self._arc_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for stage, (_, arc_points, _) in dirty:
+            percent = stage["percent"]
+            if percent:
+                if stage["poly"] is None:
+                    stage["poly"] = QPolygonF(arc_points[: percent + 1])
+                painter.drawPolyline(stage["poly"])
+
+        painter.setFont(self._pct_font)
+        for stage, (_, _, percent_rect) in dirty:
+            if stage["pct_pos"] is None:
+                stage["pct_pos"] = _centered_text_pos(stage["pct_static"], percent_rect)
+            painter.setPen(self._pct_pen_on if stage["percent"] else self._pct_pen_off)
+            painter.drawStaticText(stage["pct_pos"], stage["pct_static"])
+
+    def sizeHint(self):
+        """Provide size hint for layout managers"""
+        return self.size()
+
+
 # --- DEMO/TEST CODE ---
 
 if __name__ == "__main__":
@@ -243,7 +717,7 @@ if __name__ == "__main__":
     # Create test window
     window = QWidget()
     window.setWindowTitle("ProgressDonut Demo")
-    window.resize(500, 200)
+    window.resize(560, 200)  # Fits the 480px strip plus margins
     window.setStyleSheet(
         """
         QWidget {
@@ -256,48 +730,45 @@ if __name__ == "__main__":
     main_layout = QVBoxLayout(window)
     main_layout.setContentsMargins(20, 20, 20, 20)
 
-    # Create test donuts
-    donut_layout = QHBoxLayout()
-    donut_layout.setSpacing(20)
+    # One strip paints the five stage donuts
+    strip = StageDonutStrip(("Ruff", "Flake8", "Pylint", "Bandit", "MyPy"))
+    main_layout.addWidget(strip, alignment=Qt.AlignmentFlag.AlignCenter)
 
-    donut1 = ProgressDonut("Ruff")
-    donut2 = ProgressDonut("Flake8")
-    donut3 = ProgressDonut("Pylint")
-    donut4 = ProgressDonut("Bandit")
-    donut5 = ProgressDonut("MyPy")
+    # Create control buttons
+    button_layout = QHBoxLayout()
 
-    donuts = [donut1, donut2, donut3, donut4, donut5]
+    import random
 
-    for donut in donuts:
-        donut_layout.addWidget(donut)
+    # One timer staggers the updates, 500ms apart, instead of a singleShot
+    # per donut
+    stagger_timer = QTimer()
+    stagger_timer.setInterval(500)
+    demo_state = {"index": 0}
 
-    main_layout.addLayout(donut_layout)
+    def demo_step():
+        """Set the next stage in the stagger to a random progress"""
+        index = demo_state["index"]
+        strip.set_stage_progress(index, random.randint(0, 100))
+        demo_state["index"] = index + 1
+        if demo_state["index"] >= strip.stage_count():
+            stagger_timer.stop()
 
-    # Create control buttons
-    button_layout = QHBoxLayout()
+    stagger_timer.timeout.connect(demo_step)
 
     def simulate_progress():
         """Simulate progressive linting"""
-        import random
-
-        for i, donut in enumerate(donuts):
-            # Stagger the progress updates
-            def set_progress(d=donut, delay=i * 500):
-                QTimer.singleShot(
-                    delay, lambda d=d: d.set_progress(random.randint(0, 100))
-                )
-
-            set_progress()
+        demo_state["index"] = 0
+        demo_step()  # First stage updates immediately
+        stagger_timer.start()
 
     def reset_progress():
-        """Reset all donuts to 0"""
-        for donut in donuts:
-            donut.set_progress(0)
+        """Reset all stages to 0"""
+        strip.reset()
 
     def complete_all():
-        """Set all donuts to 100%"""
-        for donut in donuts:
-            donut.set_progress(100)
+        """Set all stages to 100%"""
+        for index in range(strip.stage_count()):
+            strip.set_stage_progress(index, 100)
 
     simulate_btn = QPushButton("Simulate Progress")
     simulate_btn.clicked.connect(simulate_progress)
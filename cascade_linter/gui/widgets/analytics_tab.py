@@ -11,8 +11,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QProgressBar,
     QGroupBox,
@@ -21,9 +20,22 @@ from PySide6.QtWidgets import (
     QComboBox,
     QFileDialog,
 )
-from PySide6.QtCore import Qt, Signal, QThread, QTimer
-from PySide6.QtGui import QFont, QPalette, QPainter, QColor
-from typing import List, Dict, Any, Optional
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QThread,
+    QTimer,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+)
+from PySide6.QtGui import QFont, QPalette, QPainter, QColor, QPixmap, QBrush
+from typing import List, Dict, Any, Optional, Tuple
+from array import array
+from string import Template
+from operator import itemgetter
+from functools import lru_cache
+import heapq
 import os
 from datetime import datetime
 
@@ -35,6 +47,263 @@ try:
 except ImportError:
     ANALYTICS_BACKEND_AVAILABLE = False
 
+# Columns of the results table (and of the CSV export)
+RESULT_COLUMNS = [
+    "Module",
+    "Risk Level",
+    "Lines",
+    "Complexity",
+    "Risk Factors",
+    "File Path",
+]
+RISK_LEVEL_COLUMN = 1
+
+# CSS class of each risk level's badge in the HTML report
+RISK_CSS_CLASSES = {
+    "CRITICAL": "risk-critical",
+    "MEDIUM": "risk-medium",
+    "LOW": "risk-low",
+}
+# Unstyled badge for any other level the backend may report
+DEFAULT_RISK_CSS_CLASS = "risk-unknown"
+
+# Status line styles: highlight for progress and success, plain for problems
+_STATUS_STYLE_HIGHLIGHT = "QLabel { color: palette(highlight); font-weight: bold; }"
+_STATUS_STYLE_WINDOW = "QLabel { color: palette(window-text); font-weight: bold; }"
+
+_HEALTH_GRADE_STYLE = """
+            QLabel {{
+                font-size: 36pt;
+                font-weight: bold;
+                color: {color};
+                border: 2px solid {color};
+                border-radius: 8px;
+                padding: 20px;
+            }}
+        """
+
+# Complete health grade stylesheets: green for A/B, orange for C, red otherwise
+_HEALTH_GRADE_STYLE_GOOD = _HEALTH_GRADE_STYLE.format(color="#73d216")
+_HEALTH_GRADE_STYLE_FAIR = _HEALTH_GRADE_STYLE.format(color="#f57900")
+_HEALTH_GRADE_STYLE_POOR = _HEALTH_GRADE_STYLE.format(color="#cc0000")
+_HEALTH_GRADE_STYLES = {
+    "A": _HEALTH_GRADE_STYLE_GOOD,
+    "B": _HEALTH_GRADE_STYLE_GOOD,
+    "C": _HEALTH_GRADE_STYLE_FAIR,
+}
+
+# Export method for each supported file extension
+_EXPORTERS = {
+    ".json": "export_to_json",
+    ".csv": "export_to_csv",
+    ".html": "export_to_html",
+    ".txt": "export_to_text_summary",
+}
+
+# Order of the risk levels listed as high-priority in the text summary
+_PRIORITY_RANKS = {"CRITICAL": 0, "MEDIUM": 1}
+
+# Fixed frame of the HTML report; only the header fields are substituted
+_HTML_HEAD = Template(
+    """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Cascade Linter - Dependency Analysis Report</title>
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 20px; background: #f5f5f5; }
+        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+        .summary { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 20px; }
+        .metric-card { background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .metric-value { font-size: 24px; font-weight: bold; color: #3498db; }
+        .table-container { background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        table { width: 100%; border-collapse: collapse; }
+        th { background: #34495e; color: white; padding: 12px; text-align: left; }
+        td { padding: 10px; border-bottom: 1px solid #ecf0f1; }
+        tr:nth-child(even) { background: #f8f9fa; }
+        .risk-critical { background: #e74c3c; color: white; padding: 4px 8px; border-radius: 4px; }
+        .risk-medium { background: #f39c12; color: white; padding: 4px 8px; border-radius: 4px; }
+        .risk-low { background: #27ae60; color: white; padding: 4px 8px; border-radius: 4px; }
+        .footer { margin-top: 20px; text-align: center; color: #7f8c8d; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🔍 Cascade Linter - Dependency Analysis Report</h1>
+        <p>Generated on $generated</p>
+    </div>
+    
+    <div class="summary">
+        <div class="metric-card">
+            <h3>Total Modules</h3>
+            <div class="metric-value">$total</div>
+        </div>
+        <div class="metric-card">
+            <h3>Critical Risks</h3>
+            <div class="metric-value" style="color: #e74c3c;">$critical</div>
+        </div>
+        <div class="metric-card">
+            <h3>Medium Risks</h3>
+            <div class="metric-value" style="color: #f39c12;">$medium</div>
+        </div>
+        <div class="metric-card">
+            <h3>Low Risks</h3>
+            <div class="metric-value" style="color: #27ae60;">$low</div>
+        </div>
+    </div>
+    
+    <div class="table-container">
+        <table>
+            <thead>
+                <tr>
+                    <th>Module</th>
+                    <th>Risk Level</th>
+                    <th>Lines</th>
+                    <th>Complexity</th>
+                    <th>Risk Factors</th>
+                    <th>File Path</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+)
+
+_HTML_TAIL = """
+            </tbody>
+        </table>
+    </div>
+    
+    <div class="footer">
+        <p>Report generated by Cascade Linter - Professional Code Quality Tool</p>
+    </div>
+</body>
+</html>
+"""
+
+# Text summary templates, joined once at import and filled with str.format
+_TEXT_REPORT_HEAD = "\n".join(
+    (
+        "=" * 80,
+        "🔍 CASCADE LINTER - DEPENDENCY ANALYSIS REPORT",
+        "=" * 80,
+        "Generated: {generated}",
+        "Tool Version: Cascade Linter v1.0.0",
+        "",
+        "📊 EXECUTIVE SUMMARY",
+        "-" * 40,
+        "Total Modules Analyzed: {total}",
+        "Critical Risk Modules: {critical}",
+        "Medium Risk Modules: {medium}",
+        "Low Risk Modules: {low}",
+        "",
+        "Overall Project Health: {grade}",
+        "Average Risk Score: {average_risk:.2f}",
+        "",
+        "🚨 HIGH-PRIORITY ISSUES",
+        "-" * 40,
+        "",
+    )
+)
+
+_TEXT_MODULE_ENTRY = "\n".join(
+    (
+        "{index:2d}. {name}",
+        "    Risk Level: {risk_level}",
+        "    Lines of Code: {lines}",
+        "    Complexity Score: {complexity:.1f}",
+        "    Risk Factors: {factors}",
+        "    File: {path}",
+        "",
+        "",
+    )
+)
+
+_TEXT_NO_ISSUES = "✅ No high-priority issues found!\n\n"
+
+_TEXT_CRITICAL_ACTIONS = "\n".join(
+    (
+        "🔴 CRITICAL ACTIONS NEEDED:",
+        "   • {critical} modules require immediate attention",
+        "   • Focus on reducing complexity and file size",
+        "   • Consider refactoring large modules (>500 lines)",
+        "",
+        "",
+    )
+)
+
+_TEXT_MEDIUM_PRIORITY = "\n".join(
+    (
+        "🟡 MEDIUM PRIORITY:",
+        "   • {medium} modules need improvement",
+        "   • Review and simplify complex functions",
+        "   • Add documentation and tests",
+        "",
+        "",
+    )
+)
+
+_TEXT_EXCELLENT = "\n".join(
+    (
+        "🎉 EXCELLENT CODE QUALITY!",
+        "   • No critical or medium risk issues found",
+        "   • Continue following current best practices",
+        "   • Regular monitoring recommended",
+        "",
+        "",
+    )
+)
+
+# Recommendations and closing section; the blocks are the sections above
+_TEXT_REPORT_TAIL = "\n".join(
+    (
+        "💡 RECOMMENDATIONS",
+        "-" * 40,
+        "{critical_block}{medium_block}{excellent_block}📈 NEXT STEPS",
+        "-" * 40,
+        "1. Address critical risk modules first",
+        "2. Implement code review practices",
+        "3. Set up automated quality gates",
+        "4. Schedule regular dependency analysis",
+        "5. Monitor complexity metrics over time",
+        "",
+        "=" * 80,
+        "End of Report - Cascade Linter Professional Code Quality Tool",
+        "=" * 80,
+        "",
+    )
+)
+
+
+# One results row: name, risk level, lines, complexity, risk factors, file path
+ResultRow = Tuple[str, str, int, float, List[str], str]
+
+
+def _build_rows(results: Dict[str, Any]) -> List[ResultRow]:
+    """Flatten the analysis results into rows shared by the table and exports"""
+    get_assessment = results.get("risk_assessments", {}).get
+    rows = []
+    for module_name, module_info in results.get("modules", {}).items():
+        assessment = get_assessment(module_name, {})
+        rows.append(
+            (
+                module_name,
+                assessment.get("risk_level", "LOW"),
+                module_info.get("size_lines", 0),
+                module_info.get("complexity_score", 0),
+                assessment.get("risk_factors", []),
+                module_info.get("file_path", ""),
+            )
+        )
+    return rows
+
+
+@lru_cache(maxsize=1024)
+def _reldir(abs_dir: str, cwd: str) -> str:
+    """Relative form of a directory - cached, since modules share directories"""
+    return os.path.relpath(abs_dir, cwd)
+
 
 class AnalyticsWorker(QThread):
     """Worker thread for running dependency analysis"""
@@ -66,6 +335,15 @@ class AnalyticsWorker(QThread):
 class RiskDistributionWidget(QWidget):
     """Mini bar chart widget for risk distribution visualization"""
 
+    # Bar colors, built once for every paint
+    CRITICAL_COLOR = QColor("#cc0000")  # Red
+    MEDIUM_COLOR = QColor("#f57900")  # Orange
+    LOW_COLOR = QColor("#73d216")  # Green
+    TEXT_COLOR = QColor("#daffd4")  # Retro green theme text color
+
+    # Label font, created on first paint once a QApplication exists
+    _label_font: Optional[QFont] = None
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.critical_count = 0
@@ -74,16 +352,60 @@ class RiskDistributionWidget(QWidget):
         self.setFixedHeight(60)
         self.setMinimumWidth(200)
 
+        # Rendered chart, reused until the counts or size change
+        self._cache: Optional[QPixmap] = None
+        self._cache_key = None
+
+    @classmethod
+    def _init_resources(cls) -> None:
+        """Build the shared label font"""
+        font = QFont()
+        font.setPointSize(8)
+        cls._label_font = font
+
     def update_data(self, critical: int, medium: int, low: int) -> None:
         """Update the risk distribution data"""
+        if (critical, medium, low) == (
+            self.critical_count,
+            self.medium_count,
+            self.low_count,
+        ):
+            return  # Same counts, same pixels
+
         self.critical_count = critical
         self.medium_count = medium
         self.low_count = low
         self.update()  # Trigger repaint
 
+    def resizeEvent(self, event) -> None:
+        """Invalidate the cached chart when the size changes"""
+        super().resizeEvent(event)
+        self._cache = None
+
     def paintEvent(self, event) -> None:
-        """Custom paint event to draw the mini bar chart"""
-        painter = QPainter(self)
+        """Custom paint event to blit the cached mini bar chart"""
+        dpr = self.devicePixelRatioF()
+        cache_key = (
+            self.critical_count,
+            self.medium_count,
+            self.low_count,
+            self.width(),
+            self.height(),
+            dpr,
+        )
+        if self._cache is None or cache_key != self._cache_key:
+            self._cache = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            self._cache.setDevicePixelRatio(dpr)
+            self._cache.fill(Qt.GlobalColor.transparent)
+            cache_painter = QPainter(self._cache)
+            self._render_chart(cache_painter)
+            cache_painter.end()
+            self._cache_key = cache_key
+
+        QPainter(self).drawPixmap(0, 0, self._cache)
+
+    def _render_chart(self, painter: QPainter) -> None:
+        """Draw the mini bar chart"""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Calculate total and proportions
@@ -96,37 +418,27 @@ class RiskDistributionWidget(QWidget):
         x_start = 10
         y_start = 15
 
-        # Calculate bar widths
-        critical_width = int((self.critical_count / total) * width) if total > 0 else 0
-        medium_width = int((self.medium_count / total) * width) if total > 0 else 0
-        low_width = width - critical_width - medium_width  # Remaining space
+        # Calculate bar widths (integer math; low takes the remaining space)
+        critical_width = self.critical_count * width // total
+        medium_width = self.medium_count * width // total
+        low_width = width - critical_width - medium_width
 
-        # Draw bars
+        # Draw bars: critical (red), medium (orange), low (green)
         current_x = x_start
-
-        # Critical (red)
-        if critical_width > 0:
-            painter.fillRect(
-                current_x, y_start, critical_width, height, QColor("#cc0000")
-            )
-            current_x += critical_width
-
-        # Medium (orange)
-        if medium_width > 0:
-            painter.fillRect(
-                current_x, y_start, medium_width, height, QColor("#f57900")
-            )
-            current_x += medium_width
-
-        # Low (green)
-        if low_width > 0:
-            painter.fillRect(current_x, y_start, low_width, height, QColor("#73d216"))
+        for color, bar_width in (
+            (self.CRITICAL_COLOR, critical_width),
+            (self.MEDIUM_COLOR, medium_width),
+            (self.LOW_COLOR, low_width),
+        ):
+            if bar_width > 0:
+                painter.fillRect(current_x, y_start, bar_width, height, color)
+                current_x += bar_width
 
         # Draw labels
-        painter.setPen(QColor("#daffd4"))  # Retro green theme text color
-        font = QFont()
-        font.setPointSize(8)
-        painter.setFont(font)
+        if RiskDistributionWidget._label_font is None:
+            RiskDistributionWidget._init_resources()
+        painter.setPen(self.TEXT_COLOR)
+        painter.setFont(self._label_font)
 
         # Draw counts below bars
         painter.drawText(x_start, y_start + height + 15, f"🔴 {self.critical_count}")
@@ -134,6 +446,120 @@ class RiskDistributionWidget(QWidget):
         painter.drawText(x_start + 120, y_start + height + 15, f"🟢 {self.low_count}")
 
 
+class ModulesModel(QAbstractTableModel):
+    """Table model over the analyzed modules, stored one column per array
+
+    Cells are formatted on demand in data(), so only the rows the view
+    actually paints are ever turned into strings.
+    """
+
+    # Cell brushes keyed by risk level, built from the palette once
+    _backgrounds: Optional[Dict[str, QBrush]] = None
+    _foregrounds: Optional[Dict[str, QBrush]] = None
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        if ModulesModel._backgrounds is None:
+            ModulesModel._init_brushes()
+
+        self._names: List[str] = []
+        self._risks: List[str] = []
+        self._lines = array("i")
+        self._complexity = array("d")
+        self._factors: List[str] = []
+        self._paths: List[str] = []
+
+    @classmethod
+    def _init_brushes(cls) -> None:
+        """Build the shared brushes (needs a running QApplication)"""
+        palette = QPalette()
+        cls._backgrounds = {"CRITICAL": palette.brush(QPalette.ColorRole.Window)}
+        cls._foregrounds = {"CRITICAL": palette.brush(QPalette.ColorRole.WindowText)}
+
+    def set_columns(
+        self,
+        names: List[str],
+        risks: List[str],
+        lines: List[int],
+        complexity: List[float],
+        factors: List[str],
+        paths: List[str],
+    ) -> None:
+        """Replace the model contents with new column data"""
+        self.beginResetModel()
+        self._names = names
+        self._risks = risks
+        self._lines = array("i", lines)
+        self._complexity = array("d", complexity)
+        self._factors = factors
+        self._paths = paths
+        self.endResetModel()
+
+    def iter_rows(self, risk_level: Optional[str] = None):
+        """Yield the display text of every row, optionally for one risk level"""
+        rows = zip(
+            self._names,
+            self._risks,
+            self._lines,
+            (f"{value:.1f}" for value in self._complexity),
+            self._factors,
+            self._paths,
+        )
+        if risk_level is None:
+            return rows
+        return (row for row in rows if row[RISK_LEVEL_COLUMN] == risk_level)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(RESULT_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return RESULT_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        # Raw numbers for sorting, so the proxy never compares formatted text
+        if role == Qt.ItemDataRole.EditRole:
+            if column == 2:
+                return self._lines[row]
+            if column == 3:
+                return self._complexity[row]
+            role = Qt.ItemDataRole.DisplayRole
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return self._names[row]
+            if column == 1:
+                return self._risks[row]
+            if column == 2:
+                return str(self._lines[row])
+            if column == 3:
+                return f"{self._complexity[row]:.1f}"
+            if column == 4:
+                return self._factors[row]
+            if column == 5:
+                return self._paths[row]
+        elif column == RISK_LEVEL_COLUMN:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._backgrounds.get(self._risks[row])
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._foregrounds.get(self._risks[row])
+
+        return None
+
+
 class AnalyticsTab(QWidget):
     """Real Analytics Tab with live dependency analysis"""
 
@@ -146,17 +572,22 @@ class AnalyticsTab(QWidget):
         super().__init__(parent)
 
         # State
-        self.directories_to_analyze: List[str] = []
+        self.directories_to_analyze: Tuple[str, ...] = ()
         self.current_analysis: Optional[Dict[str, Any]] = None
+        self._rows: List[ResultRow] = []
         self.worker_thread: Optional[AnalyticsWorker] = None
+        self._status_style: Optional[str] = None
 
         # Initialize UI
         self.init_ui()
 
-        # Auto-refresh timer
-        self.refresh_timer = QTimer()
+        # Display refresh - only armed when new results arrive, so an idle tab
+        # never wakes up; repeated results within the interval are coalesced
+        self._dirty = False
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(250)
         self.refresh_timer.timeout.connect(self.refresh_display)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds if needed
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -194,9 +625,9 @@ class AnalyticsTab(QWidget):
         main_layout.addLayout(header_layout)
 
         # === STATUS SECTION ===
-        self.lbl_status = QLabel("Ready - Select directories to analyze")
-        self.lbl_status.setStyleSheet(
-            "QLabel { color: palette(highlight); font-weight: bold; }"
+        self.lbl_status = QLabel()
+        self._set_status(
+            "Ready - Select directories to analyze", _STATUS_STYLE_HIGHLIGHT
         )
         main_layout.addWidget(self.lbl_status)
 
@@ -232,18 +663,8 @@ class AnalyticsTab(QWidget):
         # Health Grade
         self.lbl_health_grade = QLabel("—")
         self.lbl_health_grade.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_health_grade.setStyleSheet(
-            """
-            QLabel {
-                font-size: 36pt;
-                font-weight: bold;
-                color: #73d216;
-                border: 2px solid #73d216;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """
-        )
+        self.lbl_health_grade.setStyleSheet(_HEALTH_GRADE_STYLE_GOOD)
+        self._health_grade_style = _HEALTH_GRADE_STYLE_GOOD
         health_layout.addWidget(self.lbl_health_grade, 0, 0, 1, 2)
 
         # Metrics
@@ -290,12 +711,15 @@ class AnalyticsTab(QWidget):
         filter_layout.addStretch()
         details_layout.addLayout(filter_layout)
 
-        # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels(
-            ["Module", "Risk Level", "Lines", "Complexity", "Risk Factors", "File Path"]
-        )
+        # Results table - the risk filter runs in the proxy model, in C++
+        self.results_model = ModulesModel(self)
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setFilterKeyColumn(RISK_LEVEL_COLUMN)
+        self.results_proxy.setSortRole(Qt.ItemDataRole.EditRole)
+
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
 
         # Configure table
         header = self.results_table.horizontalHeader()
@@ -307,6 +731,7 @@ class AnalyticsTab(QWidget):
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
 
         self.results_table.setAlternatingRowColors(True)
+        self.results_table.setSortingEnabled(True)
         self.results_table.setSelectionBehavior(
             self.results_table.SelectionBehavior.SelectRows
         )
@@ -317,38 +742,43 @@ class AnalyticsTab(QWidget):
     def start_analysis(self):
         """Start dependency analysis in background thread"""
         if not self.directories_to_analyze:
-            self.lbl_status.setText("No directories selected for analysis")
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(window-text); font-weight: bold; }"
+            self._set_status(
+                "No directories selected for analysis", _STATUS_STYLE_WINDOW
             )
             return
 
         if not ANALYTICS_BACKEND_AVAILABLE:
-            self.lbl_status.setText("Analytics backend not available")
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(window-text); font-weight: bold; }"
-            )
+            self._set_status("Analytics backend not available", _STATUS_STYLE_WINDOW)
             return
 
         # Prepare UI for analysis
         self.btn_run_analysis.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
-        self.lbl_status.setText("Starting dependency analysis...")
-        self.lbl_status.setStyleSheet(
-            "QLabel { color: palette(highlight); font-weight: bold; }"
-        )
+        self._set_status("Starting dependency analysis...", _STATUS_STYLE_HIGHLIGHT)
 
         # Emit signal for main window
         self.analysisStarted.emit()
 
-        # Start worker thread
-        self.worker_thread = AnalyticsWorker(self.directories_to_analyze)
-        self.worker_thread.progress_updated.connect(self.on_progress_updated)
-        self.worker_thread.analysis_completed.connect(self.on_analysis_completed)
-        self.worker_thread.analysis_failed.connect(self.on_analysis_failed)
+        # Start worker thread - one worker and analyzer serve every run
+        if self.worker_thread is None:
+            self.worker_thread = AnalyticsWorker(self.directories_to_analyze)
+            self.worker_thread.progress_updated.connect(self.on_progress_updated)
+            self.worker_thread.analysis_completed.connect(self.on_analysis_completed)
+            self.worker_thread.analysis_failed.connect(self.on_analysis_failed)
+        else:
+            # run() emits its result just before returning; let it finish
+            self.worker_thread.wait()
+            self.worker_thread.directories = self.directories_to_analyze
         self.worker_thread.start()
 
+    def _set_status(self, text: str, style: str):
+        """Show a status message, re-applying the stylesheet only on change"""
+        self.lbl_status.setText(text)
+        if style is not self._status_style:
+            self.lbl_status.setStyleSheet(style)
+            self._status_style = style
+
     def on_progress_updated(self, message: str):
         """Handle progress updates from worker thread"""
         self.lbl_status.setText(message)
@@ -357,15 +787,15 @@ class AnalyticsTab(QWidget):
     def on_analysis_completed(self, results: Dict[str, Any]):
         """Handle completed analysis results"""
         self.current_analysis = results
+        self._rows = _build_rows(results)
 
         # Update UI
         self.progress_bar.setVisible(False)
         self.btn_run_analysis.setEnabled(True)
         self.btn_export.setEnabled(True)
 
-        # Update display
-        self.update_summary_display(results)
-        self.update_details_table(results)
+        # Update display on the next refresh
+        self.mark_dirty()
 
         # Update status
         total_modules = results.get("total_modules", 0)
@@ -373,18 +803,14 @@ class AnalyticsTab(QWidget):
         critical_count = risk_distribution.get("CRITICAL", 0)
 
         if critical_count > 0:
-            self.lbl_status.setText(
-                f"Analysis complete: {total_modules} modules, {critical_count} critical risks"
-            )
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(window-text); font-weight: bold; }"
+            self._set_status(
+                f"Analysis complete: {total_modules} modules, {critical_count} critical risks",
+                _STATUS_STYLE_WINDOW,
             )
         else:
-            self.lbl_status.setText(
-                f"Analysis complete: {total_modules} modules, all healthy"
-            )
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(highlight); font-weight: bold; }"
+            self._set_status(
+                f"Analysis complete: {total_modules} modules, all healthy",
+                _STATUS_STYLE_HIGHLIGHT,
             )
 
         # Emit signal for main window
@@ -394,13 +820,12 @@ class AnalyticsTab(QWidget):
         """Handle analysis failure"""
         self.progress_bar.setVisible(False)
         self.btn_run_analysis.setEnabled(True)
-        self.lbl_status.setText(f"Analysis failed: {error_message}")
-        self.lbl_status.setStyleSheet(
-            "QLabel { color: palette(window-text); font-weight: bold; }"
-        )
+        self._set_status(f"Analysis failed: {error_message}", _STATUS_STYLE_WINDOW)
 
     def update_summary_display(self, results: Dict[str, Any]):
         """Update the project health summary display"""
+        # Averages and risk counts are reduced by the backend (with NumPy when
+        # available), so nothing here iterates over the modules
         project_health = results.get("project_health", {})
         risk_distribution = results.get("risk_distribution", {})
 
@@ -408,26 +833,11 @@ class AnalyticsTab(QWidget):
         health_grade = project_health.get("health_grade", "—")
         self.lbl_health_grade.setText(health_grade)
 
-        # Color based on grade
-        if health_grade in ["A", "B"]:
-            color = "#73d216"  # Green
-        elif health_grade == "C":
-            color = "#f57900"  # Orange
-        else:
-            color = "#cc0000"  # Red
-
-        self.lbl_health_grade.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 36pt;
-                font-weight: bold;
-                color: {color};
-                border: 2px solid {color};
-                border-radius: 8px;
-                padding: 20px;
-            }}
-        """
-        )
+        # Color based on grade; the stylesheet is only re-applied on change
+        style = _HEALTH_GRADE_STYLES.get(health_grade, _HEALTH_GRADE_STYLE_POOR)
+        if style is not self._health_grade_style:
+            self.lbl_health_grade.setStyleSheet(style)
+            self._health_grade_style = style
 
         # Metrics
         self.lbl_total_modules.setText(str(results.get("total_modules", 0)))
@@ -441,54 +851,47 @@ class AnalyticsTab(QWidget):
             risk_distribution.get("LOW", 0),
         )
 
-    def update_details_table(self, results: Dict[str, Any]):
+    def update_details_table(self):
         """Update the detailed results table"""
-        modules = results.get("modules", {})
-        risk_assessments = results.get("risk_assessments", {})
-
-        # Clear existing data
-        self.results_table.setRowCount(0)
-
-        # Populate table
-        for module_name, module_info in modules.items():
-            assessment = risk_assessments.get(module_name, {})
-
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-
-            # Module name
-            self.results_table.setItem(row, 0, QTableWidgetItem(module_name))
-
-            # Risk level with color
-            risk_level = assessment.get("risk_level", "LOW")
-            risk_item = QTableWidgetItem(risk_level)
-            if risk_level == "CRITICAL":
-                risk_item.setBackground(QPalette().color(QPalette.ColorRole.Window))
-                risk_item.setForeground(QPalette().color(QPalette.ColorRole.WindowText))
-            self.results_table.setItem(row, 1, risk_item)
+        names = []
+        risks = []
+        lines = []
+        complexity = []
+        factors = []
+        paths = []
+
+        # Paths under the working directory are shortened by slicing the prefix
+        cwd = os.getcwd()
+        cwd_prefix = os.path.join(cwd, "")
+        prefix_length = len(cwd_prefix)
+
+        for (
+            module_name,
+            risk_level,
+            size_lines,
+            score,
+            risk_factors,
+            file_path,
+        ) in self._rows:
+            names.append(module_name)
+            risks.append(risk_level)
+            lines.append(size_lines)
+            complexity.append(score)
+            factors.append("; ".join(risk_factors) if risk_factors else "None")
 
-            # Lines of code
-            lines = module_info.get("size_lines", 0)
-            self.results_table.setItem(row, 2, QTableWidgetItem(str(lines)))
-
-            # Complexity score
-            complexity = module_info.get("complexity_score", 0)
-            self.results_table.setItem(row, 3, QTableWidgetItem(f"{complexity:.1f}"))
-
-            # Risk factors
-            risk_factors = assessment.get("risk_factors", [])
-            factors_text = "; ".join(risk_factors) if risk_factors else "None"
-            self.results_table.setItem(row, 4, QTableWidgetItem(factors_text))
-
-            # File path
-            file_path = module_info.get("file_path", "")
             # Show relative path for readability
-            if os.path.isabs(file_path):
+            if file_path.startswith(cwd_prefix):
+                file_path = file_path[prefix_length:]
+            elif os.path.isabs(file_path):
+                directory, basename = os.path.split(file_path)
                 try:
-                    file_path = os.path.relpath(file_path)
+                    file_path = os.path.join(_reldir(directory, cwd), basename)
                 except ValueError:
                     pass  # Keep absolute path if relpath fails
-            self.results_table.setItem(row, 5, QTableWidgetItem(file_path))
+            paths.append(file_path)
+
+        # One model reset for the whole table
+        self.results_model.set_columns(names, risks, lines, complexity, factors, paths)
 
         # Apply current filter
         self.apply_risk_filter()
@@ -497,25 +900,15 @@ class AnalyticsTab(QWidget):
         """Apply risk level filter to the table"""
         filter_text = self.risk_filter.currentText()
 
-        if filter_text == "All":
-            # Show all rows
-            for row in range(self.results_table.rowCount()):
-                self.results_table.setRowHidden(row, False)
-        else:
-            # Hide rows that don't match filter
-            for row in range(self.results_table.rowCount()):
-                risk_item = self.results_table.item(row, 1)
-                if risk_item:
-                    should_hide = risk_item.text() != filter_text.upper()
-                    self.results_table.setRowHidden(row, should_hide)
+        # Risk levels are distinct words, so a fixed-string match is exact
+        self.results_proxy.setFilterFixedString(
+            "" if filter_text == "All" else filter_text.upper()
+        )
 
     def export_results(self):
         """Export analysis results with comprehensive format options"""
         if not self.current_analysis:
-            self.lbl_status.setText("No analysis data to export")
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(window-text); font-weight: bold; }"
-            )
+            self._set_status("No analysis data to export", _STATUS_STYLE_WINDOW)
             return
 
         from datetime import datetime
@@ -525,34 +918,25 @@ class AnalyticsTab(QWidget):
             self,
             "Export Analysis Results",
             f"dependency_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            "JSON Report (*.json);;CSV Data (*.csv);;HTML Report (*.html);;Detailed Summary (*.txt);;All Formats (*.*)",
+            "JSON Report (*.json);;CSV Data (*.csv);;HTML Report (*.html);;Detailed Summary (*.txt)",
         )
 
         if filename:
             try:
-                if filename.endswith(".json") or "JSON" in selected_filter:
-                    self.export_to_json(filename)
-                elif filename.endswith(".csv") or "CSV" in selected_filter:
-                    self.export_to_csv(filename)
-                elif filename.endswith(".html") or "HTML" in selected_filter:
-                    self.export_to_html(filename)
-                elif filename.endswith(".txt") or "Summary" in selected_filter:
-                    self.export_to_text_summary(filename)
-                else:
-                    # Default to JSON if unclear
-                    if not filename.endswith((".json", ".csv", ".html", ".txt")):
-                        filename += ".json"
-                    self.export_to_json(filename)
-
-                self.lbl_status.setText(f"Results exported to {filename}")
-                self.lbl_status.setStyleSheet(
-                    "QLabel { color: palette(highlight); font-weight: bold; }"
+                ext = os.path.splitext(filename)[1].lower()
+                if ext not in _EXPORTERS:
+                    # No known extension - take the one of the chosen filter
+                    ext = selected_filter[selected_filter.rfind("*") + 1 : -1]
+                    if ext not in _EXPORTERS:
+                        ext = ".json"  # Default to JSON if unclear
+                    filename += ext
+                getattr(self, _EXPORTERS[ext])(filename)
+
+                self._set_status(
+                    f"Results exported to {filename}", _STATUS_STYLE_HIGHLIGHT
                 )
             except Exception as e:
-                self.lbl_status.setText(f"Export failed: {str(e)}")
-                self.lbl_status.setStyleSheet(
-                    "QLabel { color: palette(window-text); font-weight: bold; }"
-                )
+                self._set_status(f"Export failed: {str(e)}", _STATUS_STYLE_WINDOW)
 
     def export_to_json(self, filename: str):
         """Export comprehensive JSON report"""
@@ -581,29 +965,19 @@ class AnalyticsTab(QWidget):
         """Export results to CSV format"""
         import csv
 
-        with open(filename, "w", newline="") as csvfile:
+        filter_text = self.risk_filter.currentText()
+        risk_level = None if filter_text == "All" else filter_text.upper()
+
+        with open(
+            filename, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as csvfile:
             writer = csv.writer(csvfile)
 
             # Header
-            writer.writerow(
-                [
-                    "Module",
-                    "Risk Level",
-                    "Lines",
-                    "Complexity",
-                    "Risk Factors",
-                    "File Path",
-                ]
-            )
+            writer.writerow(RESULT_COLUMNS)
 
-            # Data from table
-            for row in range(self.results_table.rowCount()):
-                if not self.results_table.isRowHidden(row):
-                    row_data = []
-                    for col in range(self.results_table.columnCount()):
-                        item = self.results_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    writer.writerow(row_data)
+            # Rows matching the current filter, straight from the model columns
+            writer.writerows(self.results_model.iter_rows(risk_level))
 
     def export_to_html(self, filename: str):
         """Export results to professional HTML report"""
@@ -611,86 +985,34 @@ class AnalyticsTab(QWidget):
         # Get analysis data
         total_modules = self.current_analysis.get("total_modules", 0)
         risk_distribution = self.current_analysis.get("risk_distribution", {})
-        modules = self.current_analysis.get("modules", {})
-        risk_assessments = self.current_analysis.get("risk_assessments", {})
-
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Cascade Linter - Dependency Analysis Report</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .header {{ background: #2c3e50; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-        .summary {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 20px; }}
-        .metric-card {{ background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .metric-value {{ font-size: 24px; font-weight: bold; color: #3498db; }}
-        .table-container {{ background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th {{ background: #34495e; color: white; padding: 12px; text-align: left; }}
-        td {{ padding: 10px; border-bottom: 1px solid #ecf0f1; }}
-        tr:nth-child(even) {{ background: #f8f9fa; }}
-        .risk-critical {{ background: #e74c3c; color: white; padding: 4px 8px; border-radius: 4px; }}
-        .risk-medium {{ background: #f39c12; color: white; padding: 4px 8px; border-radius: 4px; }}
-        .risk-low {{ background: #27ae60; color: white; padding: 4px 8px; border-radius: 4px; }}
-        .footer {{ margin-top: 20px; text-align: center; color: #7f8c8d; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🔍 Cascade Linter - Dependency Analysis Report</h1>
-        <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
-    
-    <div class="summary">
-        <div class="metric-card">
-            <h3>Total Modules</h3>
-            <div class="metric-value">{total_modules}</div>
-        </div>
-        <div class="metric-card">
-            <h3>Critical Risks</h3>
-            <div class="metric-value" style="color: #e74c3c;">{risk_distribution.get('CRITICAL', 0)}</div>
-        </div>
-        <div class="metric-card">
-            <h3>Medium Risks</h3>
-            <div class="metric-value" style="color: #f39c12;">{risk_distribution.get('MEDIUM', 0)}</div>
-        </div>
-        <div class="metric-card">
-            <h3>Low Risks</h3>
-            <div class="metric-value" style="color: #27ae60;">{risk_distribution.get('LOW', 0)}</div>
-        </div>
-    </div>
-    
-    <div class="table-container">
-        <table>
-            <thead>
-                <tr>
-                    <th>Module</th>
-                    <th>Risk Level</th>
-                    <th>Lines</th>
-                    <th>Complexity</th>
-                    <th>Risk Factors</th>
-                    <th>File Path</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-
-        # Add table rows
-        for module_name, module_info in modules.items():
-            assessment = risk_assessments.get(module_name, {})
-            risk_level = assessment.get("risk_level", "LOW")
-            risk_class = f"risk-{risk_level.lower()}"
 
-            lines = module_info.get("size_lines", 0)
-            complexity = module_info.get("complexity_score", 0)
-            risk_factors = assessment.get("risk_factors", [])
-            factors_text = "; ".join(risk_factors) if risk_factors else "None"
-            file_path = module_info.get("file_path", "")
+        # Stream the report: the buffered file batches the many small writes,
+        # and no copy of the whole document is ever held in memory
+        with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(
+                _HTML_HEAD.substitute(
+                    generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    total=total_modules,
+                    critical=risk_distribution.get("CRITICAL", 0),
+                    medium=risk_distribution.get("MEDIUM", 0),
+                    low=risk_distribution.get("LOW", 0),
+                )
+            )
 
-            html_content += f"""
+            # Add table rows
+            for (
+                module_name,
+                risk_level,
+                lines,
+                complexity,
+                risk_factors,
+                file_path,
+            ) in self._rows:
+                risk_class = RISK_CSS_CLASSES.get(risk_level, DEFAULT_RISK_CSS_CLASS)
+                factors_text = "; ".join(risk_factors) if risk_factors else "None"
+
+                f.write(
+                    f"""
                 <tr>
                     <td><strong>{module_name}</strong></td>
                     <td><span class="{risk_class}">{risk_level}</span></td>
@@ -700,21 +1022,9 @@ class AnalyticsTab(QWidget):
                     <td><code>{file_path}</code></td>
                 </tr>
 """
+                )
 
-        html_content += """
-            </tbody>
-        </table>
-    </div>
-    
-    <div class="footer">
-        <p>Report generated by Cascade Linter - Professional Code Quality Tool</p>
-    </div>
-</body>
-</html>
-"""
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            f.write(_HTML_TAIL)
 
     def export_to_text_summary(self, filename: str):
         """Export a comprehensive text summary of the analysis"""
@@ -723,155 +1033,107 @@ class AnalyticsTab(QWidget):
         total_modules = self.current_analysis.get("total_modules", 0)
         risk_distribution = self.current_analysis.get("risk_distribution", {})
         project_health = self.current_analysis.get("project_health", {})
-        modules = self.current_analysis.get("modules", {})
-        risk_assessments = self.current_analysis.get("risk_assessments", {})
-
-        # Create comprehensive text report
-        report_lines = [
-            "=" * 80,
-            "🔍 CASCADE LINTER - DEPENDENCY ANALYSIS REPORT",
-            "=" * 80,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "Tool Version: Cascade Linter v1.0.0",
-            "",
-            "📊 EXECUTIVE SUMMARY",
-            "-" * 40,
-            f"Total Modules Analyzed: {total_modules}",
-            f"Critical Risk Modules: {risk_distribution.get('CRITICAL', 0)}",
-            f"Medium Risk Modules: {risk_distribution.get('MEDIUM', 0)}",
-            f"Low Risk Modules: {risk_distribution.get('LOW', 0)}",
-            "",
-            f"Overall Project Health: {project_health.get('grade', 'N/A')}",
-            f"Average Risk Score: {project_health.get('average_risk', 0.0):.2f}",
-            "",
-            "🚨 HIGH-PRIORITY ISSUES",
-            "-" * 40,
-        ]
-
-        # Add critical and medium risk modules
-        critical_modules = [
-            (name, info, risk_assessments.get(name, {}))
-            for name, info in modules.items()
-            if risk_assessments.get(name, {}).get("risk_level")
-            in ["CRITICAL", "MEDIUM"]
-        ]
-
-        critical_modules.sort(
-            key=lambda x: (
-                0 if x[2].get("risk_level") == "CRITICAL" else 1,
-                -x[1].get("size_lines", 0),
-            )
-        )
-
-        if critical_modules:
-            for i, (module_name, module_info, assessment) in enumerate(
-                critical_modules[:10], 1
-            ):
-                risk_level = assessment.get("risk_level", "LOW")
-                lines = module_info.get("size_lines", 0)
-                complexity = module_info.get("complexity_score", 0)
-                risk_factors = assessment.get("risk_factors", [])
-
-                report_lines.extend(
-                    [
-                        f"{i:2d}. {module_name}",
-                        f"    Risk Level: {risk_level}",
-                        f"    Lines of Code: {lines}",
-                        f"    Complexity Score: {complexity:.1f}",
-                        f"    Risk Factors: {', '.join(risk_factors) if risk_factors else 'None'}",
-                        f"    File: {module_info.get('file_path', 'N/A')}",
-                        "",
-                    ]
+        critical = risk_distribution.get("CRITICAL", 0)
+        medium = risk_distribution.get("MEDIUM", 0)
+
+        # Stream the report section by section through a large write buffer
+        # instead of joining it into one string first
+        with open(filename, "w", encoding="utf-8", buffering=128 * 1024) as f:
+            f.write(
+                _TEXT_REPORT_HEAD.format(
+                    generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    total=total_modules,
+                    critical=critical,
+                    medium=medium,
+                    low=risk_distribution.get("LOW", 0),
+                    grade=project_health.get("grade", "N/A"),
+                    average_risk=project_health.get("average_risk", 0.0),
                 )
-        else:
-            report_lines.append("✅ No high-priority issues found!")
-            report_lines.append("")
-
-        # Add recommendations
-        report_lines.extend(
-            [
-                "💡 RECOMMENDATIONS",
-                "-" * 40,
-            ]
-        )
-
-        if risk_distribution.get("CRITICAL", 0) > 0:
-            report_lines.extend(
-                [
-                    "🔴 CRITICAL ACTIONS NEEDED:",
-                    f"   • {risk_distribution['CRITICAL']} modules require immediate attention",
-                    "   • Focus on reducing complexity and file size",
-                    "   • Consider refactoring large modules (>500 lines)",
-                    "",
-                ]
-            )
-
-        if risk_distribution.get("MEDIUM", 0) > 0:
-            report_lines.extend(
-                [
-                    "🟡 MEDIUM PRIORITY:",
-                    f"   • {risk_distribution['MEDIUM']} modules need improvement",
-                    "   • Review and simplify complex functions",
-                    "   • Add documentation and tests",
-                    "",
-                ]
             )
 
-        if (
-            risk_distribution.get("CRITICAL", 0) == 0
-            and risk_distribution.get("MEDIUM", 0) == 0
-        ):
-            report_lines.extend(
-                [
-                    "🎉 EXCELLENT CODE QUALITY!",
-                    "   • No critical or medium risk issues found",
-                    "   • Continue following current best practices",
-                    "   • Regular monitoring recommended",
-                    "",
-                ]
+            # Add critical and medium risk modules, with their sort key computed once
+            critical_modules = []
+            for row in self._rows:
+                rank = _PRIORITY_RANKS.get(row[1])
+                if rank is not None:
+                    critical_modules.append((rank, -row[2], row))
+
+            if critical_modules:
+                # Only the ten most urgent are listed; a bounded heap picks them
+                # without sorting every candidate (ties keep their original order)
+                top_modules = heapq.nsmallest(
+                    10, critical_modules, key=itemgetter(0, 1)
+                )
+                for i, (_, _, row) in enumerate(top_modules, 1):
+                    module_name, risk_level, lines, complexity, risk_factors, path = row
+                    f.write(
+                        _TEXT_MODULE_ENTRY.format(
+                            index=i,
+                            name=module_name,
+                            risk_level=risk_level,
+                            lines=lines,
+                            complexity=complexity,
+                            factors=", ".join(risk_factors) if risk_factors else "None",
+                            path=path or "N/A",
+                        )
+                    )
+            else:
+                f.write(_TEXT_NO_ISSUES)
+
+            # Add recommendations and the closing section
+            f.write(
+                _TEXT_REPORT_TAIL.format(
+                    critical_block=(
+                        _TEXT_CRITICAL_ACTIONS.format(critical=critical)
+                        if critical > 0
+                        else ""
+                    ),
+                    medium_block=(
+                        _TEXT_MEDIUM_PRIORITY.format(medium=medium)
+                        if medium > 0
+                        else ""
+                    ),
+                    excellent_block=(
+                        _TEXT_EXCELLENT if critical == 0 and medium == 0 else ""
+                    ),
+                )
             )
 
-        report_lines.extend(
-            [
-                "📈 NEXT STEPS",
-                "-" * 40,
-                "1. Address critical risk modules first",
-                "2. Implement code review practices",
-                "3. Set up automated quality gates",
-                "4. Schedule regular dependency analysis",
-                "5. Monitor complexity metrics over time",
-                "",
-                "=" * 80,
-                "End of Report - Cascade Linter Professional Code Quality Tool",
-                "=" * 80,
-            ]
-        )
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(report_lines))
+    def mark_dirty(self):
+        """Schedule a display refresh for the current analysis"""
+        self._dirty = True
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
 
     def refresh_display(self):
         """Refresh display if needed"""
-        # This could check for file changes and trigger re-analysis
-        pass
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        if self.current_analysis:
+            self.update_summary_display(self.current_analysis)
+            self.update_details_table()
 
     # --- PUBLIC METHODS FOR MAIN WINDOW INTEGRATION ---
 
     def set_directories_from_main_window(self, directories: List[str]):
         """Set directories to analyze from main window"""
-        self.directories_to_analyze = directories.copy()
+        directories = tuple(directories)
+        if directories == self.directories_to_analyze:
+            return  # Same selection; update_ui_state calls this on every change
+
+        self.directories_to_analyze = directories
+        _reldir.cache_clear()  # New project roots, new directories
         if directories:
             self.btn_run_analysis.setEnabled(True)
-            self.lbl_status.setText(f"Ready to analyze {len(directories)} directories")
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(highlight); font-weight: bold; }"
+            self._set_status(
+                f"Ready to analyze {len(directories)} directories",
+                _STATUS_STYLE_HIGHLIGHT,
             )
         else:
             self.btn_run_analysis.setEnabled(False)
-            self.lbl_status.setText("No directories selected")
-            self.lbl_status.setStyleSheet(
-                "QLabel { color: palette(window-text); font-weight: bold; }"
-            )
+            self._set_status("No directories selected", _STATUS_STYLE_WINDOW)
 
     def get_current_analysis(self) -> Optional[Dict[str, Any]]:
         """Get current analysis results"""
@@ -7,14 +7,15 @@ Following external LLM recommendations:
 3. Remove try/except blocks around critical imports
 """
 
-# CRITICAL: Import QThread and Signal FIRST, outside any try/except blocks
-from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker
+# CRITICAL: Import the threading classes and Signal FIRST, outside any try/except blocks
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QProgressBar,
@@ -26,64 +27,131 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QApplication,
 )
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont, QTextCursor
 from PySide6.QtCore import Qt
 
 # Standard library imports
+import itertools
+import os
 import sys
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
+from enum import IntEnum
 from typing import Dict
 
 # Project imports - let these fail fast if there are issues
-from cascade_linter.core import CodeQualityRunner, LinterStage
+from cascade_linter.core import CodeQualityRunner, LinterProgressCallback, LinterStage
+
+# Every batch job uses the unified linting session with all 5 stages including
+# MyPy; the session only iterates the stages, so one shared tuple serves all jobs
+_DEFAULT_STAGES = (
+    LinterStage.RUFF,
+    LinterStage.FLAKE8,
+    LinterStage.PYLINT,
+    LinterStage.BANDIT,
+    LinterStage.MYPY,
+)
+
+
+class JobStatus(IntEnum):
+    """Batch job states; finished jobs compare >= COMPLETED"""
+
+    QUEUED = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+
+
+# Lines kept in the batch log view (and in the exported log)
+LOG_MAX_LINES = 10_000
+
+# Runners are reused across jobs, but a runner keeps per-session state, so
+# each pool thread gets its own cache keyed on the debug flag
+_runner_cache = threading.local()
+
+
+def _get_runner(debug: bool) -> CodeQualityRunner:
+    """Return this thread's CodeQualityRunner for the given debug setting"""
+    runners = getattr(_runner_cache, "runners", None)
+    if runners is None:
+        runners = _runner_cache.runners = {}
+    runner = runners.get(debug)
+    if runner is None:
+        runner = runners[debug] = CodeQualityRunner(debug=debug, simple_output=False)
+    return runner
+
 
+class _JobStopped(Exception):
+    """Raised at a stage boundary to abandon a job once the batch is stopped"""
 
-class BatchJobWorker(QThread):
+
+def _ignore(*args) -> None:
+    """Progress hook that does nothing; batch jobs report through signals"""
+
+
+class BatchJobSignals(QObject):
     """
-    Worker thread for batch processing jobs
-    Inherits from QThread (imported above) - should work now
+    Signals shared by the batch job runnables
+    QRunnable is not a QObject, so the jobs emit through this object
     """
 
     # Signals for communication with main thread
     job_started = Signal(str)  # job_id
     job_progress = Signal(str, int)  # job_id, percentage
     job_finished = Signal(str, bool, str)  # job_id, success, results
+    job_cancelled = Signal(str)  # job_id; the job did not run
     log_message = Signal(str, str)  # job_id, message
 
-    def __init__(self):
-        super().__init__()
-        self.jobs_queue = []
-        self.current_job = None
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Set by the UI thread to stop the batch; a plain attribute read is
+        # atomic under the GIL, so jobs check it without taking a lock
         self.should_stop = False
-        self.mutex = QMutex()
+        # Ids of submitted jobs that have not started. A job removes its own
+        # id to start and a stop pops the rest; each removal is atomic under
+        # the GIL, so every job is either run or released by the stop, once
+        self.unstarted = set()
 
-    def add_job(self, job_data: Dict):
-        """Add a job to the processing queue"""
-        with QMutexLocker(self.mutex):
-            self.jobs_queue.append(job_data)
 
-    def stop_processing(self):
-        """Signal the worker to stop processing"""
-        with QMutexLocker(self.mutex):
-            self.should_stop = True
+class BatchJobRunnable(QRunnable):
+    """
+    A single batch job, run on the dialog's thread pool
+    Jobs for different directories lint concurrently
+    """
 
-    def run(self):
-        """Main worker thread execution"""
-        while not self.should_stop:
-            # Get next job
-            with QMutexLocker(self.mutex):
-                if not self.jobs_queue:
-                    break
-                self.current_job = self.jobs_queue.pop(0)
+    def __init__(self, job_data: Dict, signals: BatchJobSignals):
+        super().__init__()
+        self.job_data = job_data
+        self.signals = signals
+
+        # Checks for a stop request at every stage boundary of the session
+        self.callback = LinterProgressCallback(
+            progress_func=_ignore,
+            stage_start_func=self._check_stop,
+            stage_finish_func=_ignore,
+        )
 
-            if self.current_job:
-                self.process_job(self.current_job)
-                self.current_job = None
+    def run(self):
+        """Thread pool entry point"""
+        job_id = self.job_data.get("id", "unknown")
+        try:
+            self.signals.unstarted.remove(job_id)
+        except KeyError:
+            return  # Already released by stop_batch_processing
+
+        # A job dequeued while the batch was being stopped is skipped, but
+        # still reported so the dialog can release it
+        if self.signals.should_stop:
+            self.signals.job_cancelled.emit(job_id)
+        else:
+            self.process_job(self.job_data)
 
-            # Small delay to prevent busy waiting
-            self.msleep(100)
+    def _check_stop(self, stage_name: str) -> None:
+        """Stage start hook - abandon the job once the batch is stopped"""
+        if self.signals.should_stop:
+            raise _JobStopped(stage_name)
 
     def process_job(self, job_data: Dict):
         """Process a single batch job"""
@@ -91,45 +159,41 @@ class BatchJobWorker(QThread):
         directory = job_data.get("directory", "")
         options = job_data.get("options", {})
 
-        self.job_started.emit(job_id)
-        self.log_message.emit(job_id, f"Starting batch processing: {directory}")
+        self.signals.job_started.emit(job_id)
+        self.signals.log_message.emit(job_id, f"Starting batch processing: {directory}")
 
         try:
-            # Create linter runner with refactored core
-            runner = CodeQualityRunner(
-                debug=options.get("debug", False), simple_output=False
-            )
-
-            # Use the new unified linting session approach with all 5 stages including MyPy
-            stages = [
-                LinterStage.RUFF,
-                LinterStage.FLAKE8,
-                LinterStage.PYLINT,
-                LinterStage.BANDIT,
-                LinterStage.MYPY,
-            ]
+            # Reuse this thread's linter runner
+            runner = _get_runner(bool(options.get("debug", False)))
 
-            # Run complete linting session
+            # Run complete linting session - the stages stay sequential (ruff's
+            # fixes feed the later linters); concurrency comes from the pool
+            # running several directories at once
             session = runner.run_linting_session(
                 path=directory,
-                stages=stages,
+                stages=_DEFAULT_STAGES,
                 check_only=options.get("check_only", False),
                 unsafe_fixes=options.get("unsafe_fixes", False),
+                callback=self.callback,
             )
 
             # Update progress
-            self.job_progress.emit(job_id, 100)
+            self.signals.job_progress.emit(job_id, 100)
 
             # Generate results summary from session
             results_summary = self.generate_session_summary(session)
 
-            self.job_finished.emit(job_id, session.success, results_summary)
-            self.log_message.emit(job_id, "Batch processing completed")
+            self.signals.job_finished.emit(job_id, session.success, results_summary)
+            self.signals.log_message.emit(job_id, "Batch processing completed")
+
+        except _JobStopped as e:
+            self.signals.log_message.emit(job_id, f"Stopped before {e}")
+            self.signals.job_cancelled.emit(job_id)
 
         except Exception as e:
             error_msg = f"Batch processing failed: {str(e)}"
-            self.log_message.emit(job_id, error_msg)
-            self.job_finished.emit(job_id, False, error_msg)
+            self.signals.log_message.emit(job_id, error_msg)
+            self.signals.job_finished.emit(job_id, False, error_msg)
 
     def generate_session_summary(self, session) -> str:
         """Generate a summary of the linting session results"""
@@ -148,8 +212,25 @@ class BatchProcessingDialog(QDialog):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.worker_thread = None
         self.jobs = {}  # job_id -> job_data
+        self._job_counter = itertools.count(1)  # Unique even for same-second adds
+        self._batch_running = False
+        self._pending_jobs = set()  # Ids of the current batch's unfinished jobs
+        self._close_when_idle = False  # Close was requested during a stop
+
+        # Jobs run concurrently on a private pool; half the cores, since every
+        # job already spawns linter subprocesses of its own
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(1, (os.cpu_count() or 2) // 2))
+
+        # One signal hub for every job, connected once
+        self.job_signals = BatchJobSignals(self)
+        self.job_signals.job_started.connect(self.on_job_started)
+        self.job_signals.job_progress.connect(self.on_job_progress)
+        self.job_signals.job_finished.connect(self.on_job_finished)
+        self.job_signals.job_cancelled.connect(self.on_job_cancelled)
+        self.job_signals.log_message.connect(self.on_log_message)
+
         self.setup_ui()
         self.setup_drag_drop()
 
@@ -218,6 +299,11 @@ class BatchProcessingDialog(QDialog):
         # Job list
         self.job_list = QListWidget()
         self.job_list.setMinimumHeight(300)
+        # Every row is a single line of text, so one size hint fits all and
+        # large drops are laid out in batches
+        self.job_list.setUniformItemSizes(True)
+        self.job_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.job_list.setBatchSize(256)
         layout.addWidget(self.job_list)
 
         return group
@@ -236,8 +322,19 @@ class BatchProcessingDialog(QDialog):
         self.results_text = QTextEdit()
         self.results_text.setMinimumHeight(200)
         self.results_text.setFont(QFont("Consolas", 9))
+        # Write-only log: no undo history, and only the newest lines are kept
+        self.results_text.setUndoRedoEnabled(False)
+        self.results_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         layout.addWidget(self.results_text)
 
+        # Log lines are buffered and flushed together, so a burst of worker
+        # messages costs one document layout instead of one per line
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # Export button
         export_btn = QPushButton("💾 Export Results")
         export_btn.clicked.connect(self.export_results)
@@ -258,11 +355,14 @@ class BatchProcessingDialog(QDialog):
     def dropEvent(self, event: QDropEvent):
         """Handle drop events"""
         urls = event.mimeData().urls()
+        directories = []
         for url in urls:
             if url.isLocalFile():
                 path = Path(url.toLocalFile())
                 if path.is_dir():
-                    self.add_directory_to_queue(str(path))
+                    directories.append(str(path))
+
+        self.add_directories_to_queue(directories)
 
     def add_directory(self):
         """Add directory through file dialog"""
@@ -274,25 +374,49 @@ class BatchProcessingDialog(QDialog):
 
     def add_directory_to_queue(self, directory: str):
         """Add a directory to the processing queue"""
-        job_id = f"job_{len(self.jobs) + 1}_{int(time.time())}"
+        job_id, job_data, item = self._build_job(directory)
+        self.jobs[job_id] = job_data
+        self.job_list.addItem(item)
+
+        self.log_message(f"Added to queue: {directory}")
+
+    def add_directories_to_queue(self, directories):
+        """Add several directories at once, laying out the job list only once"""
+        if not directories:
+            return
+
+        self.job_list.setUpdatesEnabled(False)
+        self.job_list.blockSignals(True)
+        try:
+            for directory in directories:
+                job_id, job_data, item = self._build_job(directory)
+                self.jobs[job_id] = job_data
+                self.job_list.addItem(item)
+        finally:
+            self.job_list.blockSignals(False)
+            self.job_list.setUpdatesEnabled(True)
+
+        self.log_messages(f"Added to queue: {directory}" for directory in directories)
+
+    def _build_job(self, directory: str):
+        """Create the job data and list item for a directory"""
+        job_id = f"job_{next(self._job_counter)}"
 
         job_data = {
             "id": job_id,
             "directory": directory,
             "options": {"check_only": False, "unsafe_fixes": False, "debug": False},
-            "status": "queued",
+            "status": JobStatus.QUEUED,
             "added_time": datetime.now(),
         }
 
-        self.jobs[job_id] = job_data
-
-        # Add to UI list
-        item_text = f"📁 {Path(directory).name} ({directory})"
+        # List item for the UI
+        name = os.path.basename(directory.rstrip("/\\"))
+        item_text = f"📁 {name} ({directory})"
         item = QListWidgetItem(item_text)
         item.setData(Qt.ItemDataRole.UserRole, job_id)
-        self.job_list.addItem(item)
 
-        self.log_message(f"Added to queue: {directory}")
+        return job_id, job_data, item
 
     def start_batch_processing(self):
         """Start the batch processing"""
@@ -302,50 +426,61 @@ class BatchProcessingDialog(QDialog):
             )
             return
 
-        # Create and start worker thread
-        self.worker_thread = BatchJobWorker()
-
-        # Connect signals
-        self.worker_thread.job_started.connect(self.on_job_started)
-        self.worker_thread.job_progress.connect(self.on_job_progress)
-        self.worker_thread.job_finished.connect(self.on_job_finished)
-        self.worker_thread.log_message.connect(self.on_log_message)
-
-        # Add jobs to worker
-        for job_data in self.jobs.values():
-            if job_data["status"] == "queued":
-                self.worker_thread.add_job(job_data)
+        queued = [
+            job_data
+            for job_data in self.jobs.values()
+            if job_data["status"] is JobStatus.QUEUED
+        ]
+        if not queued:
+            QMessageBox.information(
+                self, "No Jobs", "Every job in the queue has already been processed."
+            )
+            return
 
         # Update UI
+        self._batch_running = True
         self.start_batch_btn.setEnabled(False)
         self.stop_batch_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
 
-        # Start processing
-        self.worker_thread.start()
+        # Submit every queued job to the pool
+        self.job_signals.should_stop = False
+        self._pending_jobs = {job_data["id"] for job_data in queued}
+        self.job_signals.unstarted.update(self._pending_jobs)
+        for job_data in queued:
+            self.thread_pool.start(BatchJobRunnable(job_data, self.job_signals))
+
         self.log_message("🚀 Started batch processing...")
 
     def stop_batch_processing(self):
-        """Stop the batch processing"""
-        if self.worker_thread and self.worker_thread.isRunning():
-            self.worker_thread.stop_processing()
-            self.worker_thread.wait(5000)  # Wait up to 5 seconds
+        """Stop the batch processing without waiting for running jobs"""
+        if not self._batch_running:
+            return
 
-            if self.worker_thread.isRunning():
-                self.worker_thread.terminate()
-                self.worker_thread.wait()
+        # Running jobs stop at their next stage and report back through
+        # on_job_cancelled; jobs that have not started are released here
+        self.job_signals.should_stop = True
+        self.thread_pool.clear()
+        unstarted = self.job_signals.unstarted
+        while unstarted:
+            try:
+                self._pending_jobs.discard(unstarted.pop())
+            except KeyError:
+                break  # A job claimed the last id first
 
-        # Update UI
-        self.start_batch_btn.setEnabled(True)
         self.stop_batch_btn.setEnabled(False)
-        self.progress_bar.setVisible(False)
-
-        self.log_message("⏹️ Batch processing stopped")
+        if self._pending_jobs:
+            self.log_message(
+                f"⏹️ Stopping batch processing - waiting for "
+                f"{len(self._pending_jobs)} running job(s)..."
+            )
+        else:
+            self._finish_batch("⏹️ Batch processing stopped")
 
     def on_job_started(self, job_id: str):
         """Handle job started signal"""
         if job_id in self.jobs:
-            self.jobs[job_id]["status"] = "running"
+            self.jobs[job_id]["status"] = JobStatus.RUNNING
             self.log_message(f"▶️ Started: {self.jobs[job_id]['directory']}")
 
     def on_job_progress(self, job_id: str, percentage: int):
@@ -355,7 +490,9 @@ class BatchProcessingDialog(QDialog):
     def on_job_finished(self, job_id: str, success: bool, results: str):
         """Handle job finished signal"""
         if job_id in self.jobs:
-            self.jobs[job_id]["status"] = "completed" if success else "failed"
+            self.jobs[job_id]["status"] = (
+                JobStatus.COMPLETED if success else JobStatus.FAILED
+            )
             self.jobs[job_id]["results"] = results
 
             status_icon = "✅" if success else "❌"
@@ -363,16 +500,41 @@ class BatchProcessingDialog(QDialog):
             self.log_message(f"{status_icon} Completed: {directory}")
             self.log_message(f"   Results: {results}")
 
-        # Check if all jobs are done
-        all_done = all(
-            job["status"] in ["completed", "failed"] for job in self.jobs.values()
-        )
+        self._release_job(job_id)
+
+    def on_job_cancelled(self, job_id: str):
+        """Handle job cancelled signal - the job goes back to the queue"""
+        if job_id in self.jobs:
+            self.jobs[job_id]["status"] = JobStatus.QUEUED
+            self.log_message(f"⏭️ Skipped: {self.jobs[job_id]['directory']}")
+
+        self._release_job(job_id)
+
+    def _release_job(self, job_id: str):
+        """Mark a job of the current batch as done, finishing the batch last"""
+        # Late signals from a stopped batch's jobs are not counted
+        if job_id not in self._pending_jobs:
+            return
+
+        self._pending_jobs.discard(job_id)
+        if not self._pending_jobs:
+            if self.job_signals.should_stop:
+                self._finish_batch("⏹️ Batch processing stopped")
+            else:
+                self._finish_batch("🎉 All batch jobs completed!")
+
+    def _finish_batch(self, message: str):
+        """Return the dialog to its idle state"""
+        self._batch_running = False
+        self.start_batch_btn.setEnabled(True)
+        self.stop_batch_btn.setEnabled(False)
+        self.progress_bar.setVisible(False)
 
-        if all_done:
-            self.start_batch_btn.setEnabled(True)
-            self.stop_batch_btn.setEnabled(False)
-            self.progress_bar.setVisible(False)
-            self.log_message("🎉 All batch jobs completed!")
+        self.log_message(message)
+
+        if self._close_when_idle:
+            self._close_when_idle = False
+            self.close()
 
     def on_log_message(self, job_id: str, message: str):
         """Handle log message signal"""
@@ -380,8 +542,27 @@ class BatchProcessingDialog(QDialog):
 
     def log_message(self, message: str):
         """Add a message to the results log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.results_text.append(f"[{timestamp}] {message}")
+        self.log_messages((message,))
+
+    def log_messages(self, messages):
+        """Add several messages to the results log under one timestamp"""
+        prefix = time.strftime("[%H:%M:%S] ")
+        self._log_buffer.extend(prefix + message for message in messages)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all buffered log lines in a single insert"""
+        if not self._log_buffer:
+            return
+
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+
+        self.results_text.moveCursor(QTextCursor.MoveOperation.End)
+        if not self.results_text.document().isEmpty():
+            text = "\n" + text
+        self.results_text.insertPlainText(text)
 
     def export_results(self):
         """Export results to file"""
@@ -397,24 +578,35 @@ class BatchProcessingDialog(QDialog):
         )
 
         if filename:
+            self._flush_log()
             try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write("CASCADE LINTER BATCH PROCESSING RESULTS\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(
-                        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    )
-
-                    for job_id, job_data in self.jobs.items():
-                        f.write(f"Job: {job_id}\n")
-                        f.write(f"Directory: {job_data['directory']}\n")
-                        f.write(f"Status: {job_data['status']}\n")
-                        if "results" in job_data:
-                            f.write(f"Results: {job_data['results']}\n")
-                        f.write("-" * 30 + "\n")
-
-                    f.write("\nLOG:\n")
-                    f.write(self.results_text.toPlainText())
+                # Collect the report and hand it to the buffered file at once
+                lines = [
+                    "CASCADE LINTER BATCH PROCESSING RESULTS\n",
+                    "=" * 50 + "\n",
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                ]
+
+                for job_id, job_data in self.jobs.items():
+                    lines.append(f"Job: {job_id}\n")
+                    lines.append(f"Directory: {job_data['directory']}\n")
+                    lines.append(f"Status: {job_data['status'].name.lower()}\n")
+                    if "results" in job_data:
+                        lines.append(f"Results: {job_data['results']}\n")
+                    lines.append("-" * 30 + "\n")
+
+                lines.append("\nLOG:\n")
+
+                with open(filename, "w", encoding="utf-8", buffering=128 * 1024) as f:
+                    f.writelines(lines)
+
+                    # Stream the log block by block instead of copying the whole
+                    # document into one string
+                    block = self.results_text.document().firstBlock()
+                    while block.isValid():
+                        f.write(block.text())
+                        f.write("\n")
+                        block = block.next()
 
                 QMessageBox.information(
                     self, "Export Complete", f"Results exported to:\n{filename}"
@@ -427,7 +619,9 @@ class BatchProcessingDialog(QDialog):
 
     def closeEvent(self, event):
         """Handle dialog close event"""
-        if self.worker_thread and self.worker_thread.isRunning():
+        if self._close_when_idle:
+            event.ignore()  # Already stopping; closes once the jobs report back
+        elif self._batch_running:
             reply = QMessageBox.question(
                 self,
                 "Stop Processing?",
@@ -437,7 +631,13 @@ class BatchProcessingDialog(QDialog):
 
             if reply == QMessageBox.StandardButton.Yes:
                 self.stop_batch_processing()
-                event.accept()
+                if self._batch_running:
+                    # Closing now would block in the thread pool's destructor
+                    # until the running jobs end; close once they have
+                    self._close_when_idle = True
+                    event.ignore()
+                else:
+                    event.accept()
             else:
                 event.ignore()
         else:
@@ -491,7 +691,7 @@ if __name__ == "__main__":
     try:
         dialog = BatchProcessingDialog()
         print("✅ BatchProcessingDialog created successfully")
-        print("✅ QThread import working correctly")
+        print("✅ QThreadPool import working correctly")
 
         dialog.show()
         sys.exit(app.exec())
@@ -4,6 +4,7 @@
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from PySide6.QtCore import (
+    QObject,
     QTimer,
     Signal,
     QPropertyAnimation,
@@ -11,41 +12,187 @@ from PySide6.QtCore import (
     QRect,
     QSequentialAnimationGroup,
 )
-from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor
+from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor, QPixmap
 from PySide6.QtCore import Qt
 import math
-from typing import Optional
+import time
+from collections import deque
+from functools import partial
+from typing import Dict, Optional
+
+# All loaders run off one shared timer; a tick is the fastest loader's step
+TICK_INTERVAL_MS = 50
+
+# The timer interval is re-tuned from the last ADAPT_EVERY tick delays
+ADAPT_EVERY = 60
+
+# Dot heights over one 12-step wave cycle: a half sine, then rest
+_DOT_WAVE = tuple(
+    int(5 * math.sin(offset * math.pi / 6)) if offset < 6 else 0 for offset in range(12)
+)
+
+
+class _TickSource(QObject):
+    """
+    Single animation timer shared by every loader
+    The timer only runs while at least one loader is subscribed, and its
+    interval is shortened by the average lateness of recent ticks so the
+    animations keep their pace while the event loop is busy
+    """
+
+    tick = Signal(int)  # Monotonically increasing frame counter
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "_TickSource":
+        """Return the shared tick source, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.frame = 0
+        self._slots = {}  # id(loader) -> the loader's tick slot
+        self._watched = set()  # ids of live loaders with destroyed connected
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_timeout)
+
+        # Milliseconds each tick arrived after its nominal time
+        self._delays = deque(maxlen=ADAPT_EVERY)
+        self._last_tick = 0.0
+
+    def subscribe(self, loader: QWidget) -> None:
+        """Connect a loader's _on_tick slot, starting the timer if needed"""
+        key = id(loader)
+        if key in self._slots:
+            return
+
+        # A loader deleted while running never gets hideEvent or stop(), so
+        # drop it when its C++ object goes away
+        if key not in self._watched:
+            self._watched.add(key)
+            loader.destroyed.connect(partial(self._on_loader_destroyed, key))
+
+        slot = loader._on_tick
+        self.tick.connect(slot)
+        self._slots[key] = slot
+        if not self._timer.isActive():
+            self._delays.clear()
+            self._last_tick = 0.0
+            self._timer.start(TICK_INTERVAL_MS)
+
+    def unsubscribe(self, loader: QWidget) -> None:
+        """Disconnect a loader's tick slot, stopping the timer when idle"""
+        self._drop(id(loader))
+
+    def _on_loader_destroyed(self, key: int, obj=None) -> None:
+        """Forget a deleted loader"""
+        self._watched.discard(key)
+        self._drop(key)
+
+    def _drop(self, key: int) -> None:
+        """Disconnect one loader, stopping the timer when none remain"""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        try:
+            self.tick.disconnect(slot)
+        except (RuntimeError, TypeError):
+            pass  # Qt already dropped a destroyed receiver's connection
+        if not self._slots:
+            self._timer.stop()
+
+    def _on_timeout(self) -> None:
+        """Emit the next frame number"""
+        now = time.perf_counter()
+        if self._last_tick:
+            elapsed_ms = (now - self._last_tick) * 1000
+            self._delays.append(elapsed_ms - self._timer.interval())
+        self._last_tick = now
+
+        self.frame += 1
+        if self.frame % ADAPT_EVERY == 0:
+            self._adapt_interval()
+        self.tick.emit(self.frame)
+
+    def _adapt_interval(self) -> None:
+        """Shorten the interval by the predicted delay of the next tick"""
+        if not self._delays:
+            return
+        predicted = sum(self._delays) / len(self._delays)
+        # Never exceed the nominal step, and never spin faster than 2x
+        interval = round(TICK_INTERVAL_MS - predicted)
+        interval = max(TICK_INTERVAL_MS // 2, min(interval, TICK_INTERVAL_MS))
+        if interval != self._timer.interval():
+            self._timer.setInterval(interval)
+
+
+def _round_pen(color: QColor, width: int) -> QPen:
+    """Solid pen with round caps"""
+    return QPen(color, width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+
+
+def _fading(color: str, alpha: float) -> QColor:
+    """Copy of a color with the given opacity"""
+    faded = QColor(color)
+    faded.setAlphaF(alpha)
+    return faded
 
 
 class BeautifulArcLoader(QWidget):
     """Beautiful arc-style loader using pure PySide6"""
 
+    # Paint resources are frame-invariant and shared by every instance
+    _PEN = _round_pen(QColor("#2196F3"), 3)
+    _ARC_RECT = QRect(5, 5, 30, 30)
+    _ARC_SPAN = 120 * 16  # 120 degree arc, in 1/16ths of a degree
+    _DIRTY_RECT = QRect(3, 3, 34, 34)  # Arc rect grown by the pen width
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setFixedSize(40, 40)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.angle = 0
         self.is_spinning = False
 
-        # Animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_rotation)
-
     def start(self) -> None:
         """Start the loading animation"""
         self.is_spinning = True
-        self.timer.start(50)  # Update every 50ms for smooth animation
+        # Hidden loaders subscribe once they are shown
+        if self.isVisible():
+            _TickSource.instance().subscribe(self)
 
     def stop(self) -> None:
         """Stop the loading animation"""
         self.is_spinning = False
-        self.timer.stop()
-        self.angle = 0
-        self.update()
+        _TickSource.instance().unsubscribe(self)
+        if self.angle:  # Already at rest otherwise
+            self.angle = 0
+            self.update()
+
+    def _on_tick(self, frame: int) -> None:
+        """Advance every tick (50ms) for smooth animation"""
+        # Nothing to repaint while fully covered
+        if not self.visibleRegion().isEmpty():
+            self.update_rotation()
+
+    def showEvent(self, event) -> None:
+        """Resume ticking once shown"""
+        if self.is_spinning:
+            _TickSource.instance().subscribe(self)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """Stop ticking while hidden (closed tab, minimized window)"""
+        _TickSource.instance().unsubscribe(self)
+        super().hideEvent(event)
 
     def update_rotation(self) -> None:
         """Update the rotation angle"""
         self.angle = (self.angle + 10) % 360
-        self.update()
+        self.update(self._DIRTY_RECT)
 
     def paintEvent(self, event) -> None:
         """Paint the arc loader"""
@@ -53,107 +200,158 @@ class BeautifulArcLoader(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Setup pen
-        pen = QPen(QColor("#2196F3"), 3)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self._PEN)
 
         # Draw arc
-        rect = QRect(5, 5, 30, 30)
-        painter.drawArc(rect, self.angle * 16, 120 * 16)  # 120 degree arc
+        painter.drawArc(self._ARC_RECT, self.angle * 16, self._ARC_SPAN)
 
 
 class BeautifulSpinner(QWidget):
     """Beautiful spinner using pure PySide6"""
 
+    # One pen per spoke, fading out around the circle
+    _PENS = tuple(_round_pen(_fading("#4CAF50", 1.0 - i * 0.1), 2) for i in range(8))
+    # Rendered spokes per device pixel ratio, built on first paint
+    _pixmaps: Dict[float, QPixmap] = {}
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setFixedSize(40, 40)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.rotation = 0
         self.is_spinning = False
 
-        # Animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_rotation)
-
     def start(self) -> None:
         """Start the spinner animation"""
         self.is_spinning = True
-        self.timer.start(100)  # Update every 100ms
+        # Hidden loaders subscribe once they are shown
+        if self.isVisible():
+            _TickSource.instance().subscribe(self)
 
     def stop(self) -> None:
         """Stop the spinner animation"""
         self.is_spinning = False
-        self.timer.stop()
-        self.rotation = 0
-        self.update()
+        _TickSource.instance().unsubscribe(self)
+        if self.rotation:  # Already at rest otherwise
+            self.rotation = 0
+            self.update()
+
+    def _on_tick(self, frame: int) -> None:
+        """Advance every third tick (150ms)"""
+        # Nothing to repaint while fully covered
+        if frame % 3 == 0 and not self.visibleRegion().isEmpty():
+            self.update_rotation()
+
+    def showEvent(self, event) -> None:
+        """Resume ticking once shown"""
+        if self.is_spinning:
+            _TickSource.instance().subscribe(self)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """Stop ticking while hidden (closed tab, minimized window)"""
+        _TickSource.instance().unsubscribe(self)
+        super().hideEvent(event)
 
     def update_rotation(self) -> None:
         """Update the rotation"""
-        self.rotation = (self.rotation + 30) % 360
+        # Step one spoke at a time so the lines always land on their slots
+        self.rotation = (self.rotation + 45) % 360
         self.update()
 
+    @classmethod
+    def _pixmap_for(cls, dpr: float) -> QPixmap:
+        """Spinner lines rendered at dpr, once per ratio (needs a QApplication)"""
+        pixmap = cls._pixmaps.get(dpr)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(round(40 * dpr), round(40 * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(20, 20)
+        for pen in cls._PENS:
+            painter.setPen(pen)
+            painter.drawLine(0, -15, 0, -10)
+            painter.rotate(45)
+        painter.end()
+
+        cls._pixmaps[dpr] = pixmap
+        return pixmap
+
     def paintEvent(self, event) -> None:
         """Paint the spinner"""
+        pixmap = self._pixmap_for(self.devicePixelRatioF())
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
-        # Move to center
+        # Rotate the pre-rendered spinner about its center
         painter.translate(20, 20)
         painter.rotate(self.rotation)
-
-        # Draw spinner lines
-        for i in range(8):
-            opacity = 1.0 - (i * 0.1)
-            color = QColor("#4CAF50")
-            color.setAlphaF(opacity)
-
-            pen = QPen(color, 2)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(pen)
-
-            painter.drawLine(0, -15, 0, -10)
-            painter.rotate(45)
+        painter.drawPixmap(-20, -20, pixmap)
 
 
 class BeautifulDotsLoader(QWidget):
     """Beautiful three-dots loader using pure PySide6"""
 
+    _BRUSHES = tuple(
+        QBrush(QColor(color)) for color in ("#FF5722", "#FF9800", "#FFC107")
+    )
+    # Band swept by the dots at every wave height, plus an antialiasing pixel
+    _DIRTY_RECT = QRect(11, 6, 39, 14)
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setFixedSize(60, 20)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.dot_positions = [0, 0, 0]  # Y positions of dots
         self.is_animating = False
-
-        # Animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_animation)
         self.animation_step = 0
 
     def start(self) -> None:
         """Start the dots animation"""
         self.is_animating = True
-        self.timer.start(150)  # Update every 150ms
+        # Hidden loaders subscribe once they are shown
+        if self.isVisible():
+            _TickSource.instance().subscribe(self)
 
     def stop(self) -> None:
         """Stop the dots animation"""
         self.is_animating = False
-        self.timer.stop()
+        _TickSource.instance().unsubscribe(self)
         self.dot_positions = [0, 0, 0]
         self.animation_step = 0
         self.update()
 
+    def _on_tick(self, frame: int) -> None:
+        """Advance every third tick (150ms)"""
+        # Nothing to repaint while fully covered
+        if frame % 3 == 0 and not self.visibleRegion().isEmpty():
+            self.update_animation()
+
+    def showEvent(self, event) -> None:
+        """Resume ticking once shown"""
+        if self.is_animating:
+            _TickSource.instance().subscribe(self)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """Stop ticking while hidden (closed tab, minimized window)"""
+        _TickSource.instance().unsubscribe(self)
+        super().hideEvent(event)
+
     def update_animation(self) -> None:
         """Update the dots animation"""
         # Create wave effect
         for i in range(3):
-            offset = (self.animation_step - i * 2) % 12
-            if offset < 6:
-                self.dot_positions[i] = int(5 * math.sin(offset * math.pi / 6))
-            else:
-                self.dot_positions[i] = 0
+            self.dot_positions[i] = _DOT_WAVE[(self.animation_step - i * 2) % 12]
 
         self.animation_step += 1
-        self.update()
+        self.update(self._DIRTY_RECT)
 
     def paintEvent(self, event) -> None:
         """Paint the dots"""
@@ -161,11 +359,9 @@ class BeautifulDotsLoader(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw three dots
-        colors = ["#FF5722", "#FF9800", "#FFC107"]
-        for i, color in enumerate(colors):
-            brush = QBrush(QColor(color))
+        painter.setPen(Qt.PenStyle.NoPen)
+        for i, brush in enumerate(self._BRUSHES):
             painter.setBrush(brush)
-            painter.setPen(Qt.PenStyle.NoPen)
 
             x = 15 + i * 15
             y = 10 + self.dot_positions[i]
@@ -176,12 +372,16 @@ class BeautifulLoadingWidget(QWidget):
     """
     Beautiful loading widget with multiple animation styles
     Pure PySide6 implementation - no external dependencies
+    The loaders themselves are only built the first time they are needed
     """
 
     loadingComplete = Signal()
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        self._arc_loader: Optional[BeautifulArcLoader] = None
+        self._spinner: Optional[BeautifulSpinner] = None
+        self._dots_loader: Optional[BeautifulDotsLoader] = None
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -195,61 +395,51 @@ class BeautifulLoadingWidget(QWidget):
         title.setStyleSheet("color: #E0E0E0; margin-bottom: 10px;")
         layout.addWidget(title)
 
-        # Create different loading styles
-        self.create_arc_loader(layout)
-        self.create_spinner_loader(layout)
-        self.create_dots_loader(layout)
-
-    def create_arc_loader(self, layout: QVBoxLayout) -> None:
-        """Create arc-style loader"""
-        container = QWidget()
-        container_layout = QHBoxLayout(container)
-
-        # Label
-        label = QLabel("Arc Loader:")
-        label.setStyleSheet("color: #E0E0E0; min-width: 100px;")
-        container_layout.addWidget(label)
-
-        # Arc loader
-        self.arc_loader = BeautifulArcLoader()
-        container_layout.addWidget(self.arc_loader)
-
-        container_layout.addStretch()
-        layout.addWidget(container)
-
-    def create_spinner_loader(self, layout: QVBoxLayout) -> None:
-        """Create spinner-style loader"""
-        container = QWidget()
-        container_layout = QHBoxLayout(container)
-
-        # Label
-        label = QLabel("Spinner:")
-        label.setStyleSheet("color: #E0E0E0; min-width: 100px;")
-        container_layout.addWidget(label)
-
-        # Spinner
-        self.spinner = BeautifulSpinner()
-        container_layout.addWidget(self.spinner)
-
-        container_layout.addStretch()
-        layout.addWidget(container)
-
-    def create_dots_loader(self, layout: QVBoxLayout) -> None:
-        """Create dots loader"""
+    @property
+    def arc_loader(self) -> BeautifulArcLoader:
+        """Arc-style loader"""
+        self._ensure_loaders()
+        return self._arc_loader
+
+    @property
+    def spinner(self) -> BeautifulSpinner:
+        """Spinner-style loader"""
+        self._ensure_loaders()
+        return self._spinner
+
+    @property
+    def dots_loader(self) -> BeautifulDotsLoader:
+        """Dots loader"""
+        self._ensure_loaders()
+        return self._dots_loader
+
+    def _ensure_loaders(self) -> None:
+        """Create the loader rows on first use, always in the same order"""
+        if self._arc_loader is not None:
+            return
+
+        self._arc_loader = BeautifulArcLoader()
+        self._spinner = BeautifulSpinner()
+        self._dots_loader = BeautifulDotsLoader()
+
+        self._add_loader_row("Arc Loader:", self._arc_loader)
+        self._add_loader_row("Spinner:", self._spinner)
+        self._add_loader_row("3-Dots:", self._dots_loader)
+
+    def _add_loader_row(self, text: str, loader: QWidget) -> None:
+        """Add a labelled loader row below the title"""
         container = QWidget()
         container_layout = QHBoxLayout(container)
 
         # Label
-        label = QLabel("3-Dots:")
+        label = QLabel(text)
         label.setStyleSheet("color: #E0E0E0; min-width: 100px;")
         container_layout.addWidget(label)
 
-        # Dots loader
-        self.dots_loader = BeautifulDotsLoader()
-        container_layout.addWidget(self.dots_loader)
+        container_layout.addWidget(loader)
 
         container_layout.addStretch()
-        layout.addWidget(container)
+        self.layout().addWidget(container)
 
     def start_loading(self) -> None:
         """Start all loading animations"""
@@ -259,9 +449,11 @@ class BeautifulLoadingWidget(QWidget):
 
     def stop_loading(self) -> None:
         """Stop all loading animations"""
-        self.arc_loader.stop()
-        self.spinner.stop()
-        self.dots_loader.stop()
+        # Loaders that were never built have nothing to stop
+        if self._arc_loader is not None:
+            self._arc_loader.stop()
+            self._spinner.stop()
+            self._dots_loader.stop()
         self.loadingComplete.emit()
 
 
@@ -4,11 +4,13 @@ Widget Compatibility Layer
 Ensures existing widgets work with current core.py interface
 """
 
+import copy
+from types import SimpleNamespace
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 # Import existing sophisticated widgets
-from .batch_processing import BatchProcessingDialog, BatchJobWorker
+from .batch_processing import BatchProcessingDialog
 from .results_dashboard import ResultsDashboard as OriginalResultsDashboard
 from .issue_browser import IssueBrowserWidget as OriginalIssueBrowser
 from .settings_dialog import SettingsDialog as OriginalSettingsDialog
@@ -25,6 +27,8 @@ except ImportError:
     sys.path.insert(0, str(project_root))
     from cascade_linter.core import CodeQualityRunner, LintingSession, LinterStage
 
+from cascade_linter.config import ThemeMode
+
 
 class BatchProcessingWidget:
     """
@@ -172,70 +176,73 @@ class IssueBrowser(OriginalIssueBrowser):
         self.load_issues([])
 
 
+# Default settings for the mock config manager, built once at import
+_DEFAULT_CONFIG = SimpleNamespace(
+    general=SimpleNamespace(
+        check_only_default=False,
+        unsafe_fixes_default=False,
+        respect_gitignore=True,
+        auto_save_logs=True,
+        log_retention_days=30,
+        max_log_files=100,
+    ),
+    linters={
+        "ruff": SimpleNamespace(enabled=True, max_line_length=88),
+        "flake8": SimpleNamespace(enabled=True, max_line_length=88),
+        "pylint": SimpleNamespace(enabled=True, max_line_length=88),
+        "bandit": SimpleNamespace(enabled=True, max_line_length=88),
+        "mypy": SimpleNamespace(enabled=True, max_line_length=88),
+    },
+    ui=SimpleNamespace(
+        theme=ThemeMode.SYSTEM,
+        animation_enabled=True,
+        log_font_size=10,
+        show_line_numbers=True,
+        auto_scroll_log=True,
+    ),
+)
+
+
+class MockConfigManager:
+    """
+    Simple in-memory config manager since we don't have a real one yet
+    Settings last for the session but are not written to disk
+    """
+
+    def __init__(self):
+        self.config = copy.deepcopy(_DEFAULT_CONFIG)
+
+    def update_general_config(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self.config.general, key, value)
+
+    def update_linter_config(self, stage_id, **kwargs):
+        if stage_id in self.config.linters:
+            for key, value in kwargs.items():
+                setattr(self.config.linters[stage_id], key, value)
+
+    def update_ui_config(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self.config.ui, key, value)
+
+    def save_config(self):
+        pass  # Mock implementation
+
+    def reset_to_defaults(self):
+        self.config = copy.deepcopy(_DEFAULT_CONFIG)
+
+
+# Every SettingsDialog shares one mock config manager
+_SHARED_MOCK_CONFIG_MANAGER = MockConfigManager()
+
+
 class SettingsDialog(OriginalSettingsDialog):
     """
     Enhanced SettingsDialog with compatibility for main window
     """
 
     def __init__(self, parent=None):
-        # Create a simple mock config manager since we don't have one yet
-        class MockConfigManager:
-            def __init__(self):
-                from types import SimpleNamespace
-
-                self.config = SimpleNamespace()
-                self.config.general = SimpleNamespace()
-                self.config.general.check_only_default = False
-                self.config.general.unsafe_fixes_default = False
-                self.config.general.respect_gitignore = True
-                self.config.general.auto_save_logs = True
-                self.config.general.log_retention_days = 30
-                self.config.general.max_log_files = 100
-
-                self.config.linters = {
-                    "ruff": SimpleNamespace(enabled=True, max_line_length=88),
-                    "flake8": SimpleNamespace(enabled=True, max_line_length=88),
-                    "pylint": SimpleNamespace(enabled=True, max_line_length=88),
-                    "bandit": SimpleNamespace(enabled=True, max_line_length=88),
-                    "mypy": SimpleNamespace(enabled=True, max_line_length=88),
-                }
-
-                self.config.ui = SimpleNamespace()
-                from types import SimpleNamespace
-
-                ThemeMode = SimpleNamespace()
-                ThemeMode.SYSTEM = "system"
-                ThemeMode.LIGHT = "light"
-                ThemeMode.DARK = "dark"
-                self.config.ui.theme = ThemeMode()
-                self.config.ui.theme.value = "system"
-                self.config.ui.animation_enabled = True
-                self.config.ui.log_font_size = 10
-                self.config.ui.show_line_numbers = True
-                self.config.ui.auto_scroll_log = True
-
-            def update_general_config(self, **kwargs):
-                for key, value in kwargs.items():
-                    setattr(self.config.general, key, value)
-
-            def update_linter_config(self, stage_id, **kwargs):
-                if stage_id in self.config.linters:
-                    for key, value in kwargs.items():
-                        setattr(self.config.linters[stage_id], key, value)
-
-            def update_ui_config(self, **kwargs):
-                for key, value in kwargs.items():
-                    setattr(self.config.ui, key, value)
-
-            def save_config(self):
-                pass  # Mock implementation
-
-            def reset_to_defaults(self):
-                self.__init__()  # Reset to default values
-
-        # Use mock config manager
-        config_manager = MockConfigManager()
-        super().__init__(config_manager, parent)
+        super().__init__(_SHARED_MOCK_CONFIG_MANAGER, parent)
 
 
 # Export the compatibility layer
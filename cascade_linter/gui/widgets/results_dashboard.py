@@ -10,58 +10,13 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QGridLayout,
     QLabel,
-    QFrame,
     QGroupBox,
 )
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property
 from PySide6.QtGui import QPainter, QColor, QFont, QPen
 from typing import Dict
 
-
-class MetricCard(QFrame):
-    """Beautiful metric display card"""
-
-    def __init__(
-        self, title: str, value: str, icon: str = "📊", color: str = "#3498db"
-    ):
-        super().__init__()
-        self.setFrameStyle(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {color}20;
-                border: 2px solid {color};
-                border-radius: 8px;
-                padding: 12px;
-                margin: 4px;
-            }}
-        """)
-
-        layout = QVBoxLayout(self)
-
-        # Icon and title
-        header_layout = QHBoxLayout()
-
-        icon_label = QLabel(icon)
-        icon_label.setFont(QFont("", 20))
-        header_layout.addWidget(icon_label)
-
-        title_label = QLabel(title)
-        title_label.setFont(QFont("", 10, QFont.Bold))
-        title_label.setStyleSheet("color: gray;")
-        header_layout.addWidget(title_label)
-        header_layout.addStretch()
-
-        layout.addLayout(header_layout)
-
-        # Value
-        self.value_label = QLabel(value)
-        self.value_label.setFont(QFont("", 24, QFont.Bold))
-        self.value_label.setStyleSheet(f"color: {color};")
-        layout.addWidget(self.value_label)
-
-    def update_value(self, value: str):
-        """Update the displayed value"""
-        self.value_label.setText(value)
+from .MetricCard import MetricCard
 
 
 class CircularProgressWidget(QWidget):
@@ -141,10 +96,16 @@ class ResultsDashboard(QWidget):
         metrics_layout = QGridLayout(metrics_group)
 
         # Create metric cards
-        self.total_files_card = MetricCard("Total Files", "0", "📁", "#3498db")
-        self.issues_found_card = MetricCard("Issues Found", "0", "🔍", "#e74c3c")
-        self.fixed_issues_card = MetricCard("Auto-Fixed", "0", "🔧", "#27ae60")
-        self.time_taken_card = MetricCard("Time Taken", "0.0s", "⏱️", "#f39c12")
+        self.total_files_card = MetricCard("Total Files", "0", "📁", card_type="info")
+        self.issues_found_card = MetricCard(
+            "Issues Found", "0", "🔍", card_type="error"
+        )
+        self.fixed_issues_card = MetricCard(
+            "Auto-Fixed", "0", "🔧", card_type="success"
+        )
+        self.time_taken_card = MetricCard(
+            "Time Taken", "0.0s", "⏱️", card_type="warning"
+        )
 
         metrics_layout.addWidget(self.total_files_card, 0, 0)
         metrics_layout.addWidget(self.issues_found_card, 0, 1)